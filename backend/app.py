@@ -48,8 +48,7 @@ from src.database import init_db, engine
 from src.usage_service import (
     get_usage,
     increment_usage,
-    get_monthly_limit,
-    verify_api_key_db,
+    verify_and_load,
     log_analysis,
     get_current_month
 )
@@ -114,20 +113,6 @@ VALID_API_KEYS = set(
     if key.strip()
 )
 
-def verify_api_key(api_key: str, session: Session = None) -> bool:
-    """
-    Verify API key is valid.
-
-    Checks both environment variable (VALID_API_KEYS) and database (is_active).
-    If session is provided, uses database validation.
-    """
-    if session:
-        return verify_api_key_db(session, api_key, VALID_API_KEYS)
-    # Fallback to simple env var check
-    if not VALID_API_KEYS:
-        return True
-    return api_key in VALID_API_KEYS
-
 # --- FastAPI App ---
 
 app = FastAPI(
@@ -353,18 +338,19 @@ async def analyze(
     """
     with Session(engine) as session:
         # 1. Verify API key
-        if not verify_api_key(api_key, session):
-            log_analysis(session, api_key, "/analyze", "single_image", 0, "failed_auth")
+        is_valid, db_key = verify_and_load(session, api_key, VALID_API_KEYS)
+        if not is_valid:
+            log_analysis(session, api_key, "/analyze", "single_image", 0, "failed_auth", db_key=db_key)
             raise HTTPException(
                 status_code=403,
                 detail="Invalid or expired API key. Please check your subscription."
             )
 
         # 2. Get tier-specific limit and check usage quota
-        limit = get_monthly_limit(session, api_key, MONTHLY_LIMIT)
+        limit = db_key.monthly_limit if db_key else MONTHLY_LIMIT
         current_usage = get_usage(session, api_key)
         if current_usage >= limit:
-            log_analysis(session, api_key, "/analyze", "single_image", 0, "quota_exceeded")
+            log_analysis(session, api_key, "/analyze", "single_image", 0, "quota_exceeded", db_key=db_key)
             raise HTTPException(
                 status_code=402,
                 detail=f"Monthly quota exceeded. You've used {current_usage}/{limit} analyses this month. "
@@ -410,8 +396,8 @@ async def analyze(
             )
 
             # 8. Increment usage after successful analysis
-            new_usage = increment_usage(session, api_key, 1, MONTHLY_LIMIT)
-            log_analysis(session, api_key, "/analyze", "single_image", 1, "success")
+            new_usage = increment_usage(session, api_key, 1, MONTHLY_LIMIT, db_key=db_key)
+            log_analysis(session, api_key, "/analyze", "single_image", 1, "success", db_key=db_key)
 
             # 9. Return response
             return {
@@ -453,11 +439,12 @@ async def get_usage_info(api_key: str):
     Returns how many analyses have been used this month and the limit.
     """
     with Session(engine) as session:
-        if not verify_api_key(api_key, session):
+        is_valid, db_key = verify_and_load(session, api_key, VALID_API_KEYS)
+        if not is_valid:
             raise HTTPException(status_code=403, detail="Invalid API key")
 
         current_usage = get_usage(session, api_key)
-        limit = get_monthly_limit(session, api_key, MONTHLY_LIMIT)
+        limit = db_key.monthly_limit if db_key else MONTHLY_LIMIT
         return {
             "used_this_month": current_usage,
             "limit": limit,
@@ -560,8 +547,9 @@ async def analyze_multi(
     """
     with Session(engine) as session:
         # 1. Verify API key
-        if not verify_api_key(api_key, session):
-            log_analysis(session, api_key, "/analyze-multi", "multi_image", 0, "failed_auth")
+        is_valid, db_key = verify_and_load(session, api_key, VALID_API_KEYS)
+        if not is_valid:
+            log_analysis(session, api_key, "/analyze-multi", "multi_image", 0, "failed_auth", db_key=db_key)
             raise HTTPException(status_code=403, detail="Invalid API key")
 
         # 2. Validate file count
@@ -575,12 +563,12 @@ async def analyze_multi(
             )
 
         # 3. Check quota (each image costs 1 credit)
-        limit = get_monthly_limit(session, api_key, MONTHLY_LIMIT)
+        limit = db_key.monthly_limit if db_key else MONTHLY_LIMIT
         current_usage = get_usage(session, api_key)
         credits_needed = len(images)
 
         if current_usage + credits_needed > limit:
-            log_analysis(session, api_key, "/analyze-multi", "multi_image", 0, "quota_exceeded")
+            log_analysis(session, api_key, "/analyze-multi", "multi_image", 0, "quota_exceeded", db_key=db_key)
             raise HTTPException(
                 status_code=402,
                 detail=f"Not enough credits. You have {limit - current_usage} remaining, "
@@ -614,9 +602,9 @@ async def analyze_multi(
             result = multi.analyze_images(tmp_paths, user_context)
 
             # 7. Increment usage
-            new_usage = increment_usage(session, api_key, credits_needed, MONTHLY_LIMIT)
+            new_usage = increment_usage(session, api_key, credits_needed, MONTHLY_LIMIT, db_key=db_key)
             log_analysis(session, api_key, "/analyze-multi", "multi_image", credits_needed, "success",
-                        {"image_count": len(images)})
+                        {"image_count": len(images)}, db_key=db_key)
 
             return {
                 "success": True,
@@ -673,8 +661,9 @@ async def analyze_video(
 
     with Session(engine) as session:
         # 2. Verify API key
-        if not verify_api_key(api_key, session):
-            log_analysis(session, api_key, "/analyze-video", "video", 0, "failed_auth")
+        is_valid, db_key = verify_and_load(session, api_key, VALID_API_KEYS)
+        if not is_valid:
+            log_analysis(session, api_key, "/analyze-video", "video", 0, "failed_auth", db_key=db_key)
             raise HTTPException(status_code=403, detail="Invalid API key")
 
         # 3. Validate max_frames
@@ -706,10 +695,10 @@ async def analyze_video(
             estimated_frames = processor.estimate_frames(tmp_path)
             frames_to_use = min(estimated_frames, max_frames)
 
-            limit = get_monthly_limit(session, api_key, MONTHLY_LIMIT)
+            limit = db_key.monthly_limit if db_key else MONTHLY_LIMIT
             current_usage = get_usage(session, api_key)
             if current_usage + frames_to_use > limit:
-                log_analysis(session, api_key, "/analyze-video", "video", 0, "quota_exceeded")
+                log_analysis(session, api_key, "/analyze-video", "video", 0, "quota_exceeded", db_key=db_key)
                 raise HTTPException(
                     status_code=402,
                     detail=f"Not enough credits. You have {limit - current_usage} remaining, "
@@ -725,9 +714,9 @@ async def analyze_video(
 
             # 9. Increment usage based on actual frames analyzed
             actual_frames = result.get("successful_count", frames_to_use)
-            new_usage = increment_usage(session, api_key, actual_frames, MONTHLY_LIMIT)
+            new_usage = increment_usage(session, api_key, actual_frames, MONTHLY_LIMIT, db_key=db_key)
             log_analysis(session, api_key, "/analyze-video", "video", actual_frames, "success",
-                        {"frame_count": actual_frames})
+                        {"frame_count": actual_frames}, db_key=db_key)
 
             return {
                 "success": True,
@@ -906,8 +895,9 @@ async def analyze_figma(
 
     with Session(engine) as session:
         # Verify API key
-        if not verify_api_key(api_key, session):
-            log_analysis(session, api_key, "/analyze-figma", "figma", 0, "failed_auth")
+        is_valid, db_key = verify_and_load(session, api_key, VALID_API_KEYS)
+        if not is_valid:
+            log_analysis(session, api_key, "/analyze-figma", "figma", 0, "failed_auth", db_key=db_key)
             raise HTTPException(status_code=403, detail="Invalid API key")
 
         # Validate max_frames
@@ -931,10 +921,10 @@ async def analyze_figma(
                 frame_count = len(frames)
 
                 # Check quota
-                limit = get_monthly_limit(session, api_key, MONTHLY_LIMIT)
+                limit = db_key.monthly_limit if db_key else MONTHLY_LIMIT
                 current_usage = get_usage(session, api_key)
                 if current_usage + frame_count > limit:
-                    log_analysis(session, api_key, "/analyze-figma", "figma", 0, "quota_exceeded")
+                    log_analysis(session, api_key, "/analyze-figma", "figma", 0, "quota_exceeded", db_key=db_key)
                     raise HTTPException(
                         status_code=402,
                         detail=f"Not enough credits. You have {limit - current_usage} remaining, "
@@ -970,9 +960,9 @@ async def analyze_figma(
                 html_report = generate_site_report(result, figma_result["file_info"]["name"])
 
                 # Increment usage
-                new_usage = increment_usage(session, api_key, frame_count, MONTHLY_LIMIT)
+                new_usage = increment_usage(session, api_key, frame_count, MONTHLY_LIMIT, db_key=db_key)
                 log_analysis(session, api_key, "/analyze-figma", "figma", frame_count, "success",
-                            {"frame_count": frame_count, "file_name": figma_result["file_info"]["name"]})
+                            {"frame_count": frame_count, "file_name": figma_result["file_info"]["name"]}, db_key=db_key)
 
                 return {
                     "success": True,
@@ -1017,18 +1007,19 @@ async def analyze_url(
 
     with Session(engine) as session:
         # Verify API key
-        if not verify_api_key(api_key, session):
-            log_analysis(session, api_key, "/analyze-url", "url", 0, "failed_auth")
+        is_valid, db_key = verify_and_load(session, api_key, VALID_API_KEYS)
+        if not is_valid:
+            log_analysis(session, api_key, "/analyze-url", "url", 0, "failed_auth", db_key=db_key)
             raise HTTPException(status_code=403, detail="Invalid API key")
 
         # Validate max_pages
         max_pages = max(1, min(10, max_pages))
 
         # Check quota upfront (estimate)
-        limit = get_monthly_limit(session, api_key, MONTHLY_LIMIT)
+        limit = db_key.monthly_limit if db_key else MONTHLY_LIMIT
         current_usage = get_usage(session, api_key)
         if current_usage + max_pages > limit:
-            log_analysis(session, api_key, "/analyze-url", "url", 0, "quota_exceeded")
+            log_analysis(session, api_key, "/analyze-url", "url", 0, "quota_exceeded", db_key=db_key)
             raise HTTPException(
                 status_code=402,
                 detail=f"Not enough credits. You have {limit - current_usage} remaining, "
@@ -1040,7 +1031,7 @@ async def analyze_url(
             with tempfile.TemporaryDirectory() as tmp_dir:
                 # Crawl website
                 crawler = WebCrawler(max_pages=max_pages, max_depth=2)
-                crawl_result = crawler.crawl(url, tmp_dir)
+                crawl_result = await crawler.crawl_async(url, tmp_dir)
 
                 pages = crawl_result.get("pages", [])
                 if not pages:
@@ -1074,11 +1065,17 @@ async def analyze_url(
                 from src.report_generator import generate_site_report
                 html_report = generate_site_report(result, url)
 
-                # Increment usage based on actual pages analyzed
+                # Increment usage based on pages actually sent for analysis;
+                # skipped peripheral pages (privacy, terms, ...) are free
                 pages_analyzed = len(site_pages)
-                new_usage = increment_usage(session, api_key, pages_analyzed, MONTHLY_LIMIT)
-                log_analysis(session, api_key, "/analyze-url", "url", pages_analyzed, "success",
-                            {"pages_analyzed": pages_analyzed, "url": url})
+                credits_used = sum(
+                    1 for page_result in result.get("page_analyses", [])
+                    if not page_result.get("skipped")
+                )
+                new_usage = increment_usage(session, api_key, credits_used, MONTHLY_LIMIT, db_key=db_key)
+                log_analysis(session, api_key, "/analyze-url", "url", credits_used, "success",
+                            {"pages_analyzed": pages_analyzed, "pages_skipped": pages_analyzed - credits_used,
+                             "url": url}, db_key=db_key)
 
                 return {
                     "success": True,
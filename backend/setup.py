@@ -3,10 +3,11 @@ from setuptools import setup, find_packages
 setup(
     name="ui_traps_analyzer",
     version="1.0.0",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
+    packages=find_packages(include=["src", "src.*"]),
+    package_data={"src": ["templates/*.j2"]},
     install_requires=[
         "anthropic>=0.40.0",
         "python-dotenv>=1.0.0",
+        "jinja2>=3.1.0",
     ],
 )
\ No newline at end of file
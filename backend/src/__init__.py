@@ -14,10 +14,16 @@ Main exports:
 from .analyzer import UITrapsAnalyzer, analyze_design
 from .validators import validate_file_format, validate_context
 from .formatters import format_report_as_markdown, format_report_as_html, get_report_statistics
-from .schema import get_ui_analysis_schema
+from .schema import get_ui_analysis_schema, get_ui_analysis_tool_schema, get_ui_analysis_validator, validate_ui_analysis
 from .page_classifier import classify_page, get_relevant_tasks, generate_flow_analysis, classify_all_pages
 from .site_analyzer import SiteAnalyzer
-from .report_generator import generate_site_report_markdown, generate_site_report_html
+from .report_generator import (
+    generate_site_report_markdown,
+    generate_site_report_html,
+    iter_site_report_markdown,
+    iter_site_report_html,
+    generate_site_reports_bundle,
+)
 
 __version__ = "2.0.0"  # Updated for context-aware site analysis
 __all__ = [
@@ -33,6 +39,9 @@ __all__ = [
     "get_report_statistics",
     # Schema
     "get_ui_analysis_schema",
+    "get_ui_analysis_tool_schema",
+    "get_ui_analysis_validator",
+    "validate_ui_analysis",
     # Site-level analysis (new in v2.0)
     "classify_page",
     "classify_all_pages",
@@ -40,5 +49,8 @@ __all__ = [
     "generate_flow_analysis",
     "SiteAnalyzer",
     "generate_site_report_markdown",
-    "generate_site_report_html"
+    "generate_site_report_html",
+    "iter_site_report_markdown",
+    "iter_site_report_html",
+    "generate_site_reports_bundle"
 ]
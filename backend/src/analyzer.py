@@ -10,7 +10,7 @@ Unauthorized reproduction, distribution, or use is prohibited.
 import os
 import base64
 import time
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from anthropic import Anthropic
 
@@ -18,13 +18,25 @@ try:
     from .validators import validate_file_format, validate_context, is_figma_url
     from .prompts import build_system_prompt, build_user_message, build_figma_message
     from .formatters import parse_claude_response, format_report_as_markdown, format_report_as_html, get_report_statistics
-    from .schema import get_ui_analysis_schema
+    from .schema import get_ui_analysis_tool_schema, get_ui_analysis_validator, validate_ui_analysis
 except ImportError:
     # Fallback for direct script execution
     from validators import validate_file_format, validate_context, is_figma_url
     from prompts import build_system_prompt, build_user_message, build_figma_message
     from formatters import parse_claude_response, format_report_as_markdown, format_report_as_html, get_report_statistics
-    from schema import get_ui_analysis_schema
+    from schema import get_ui_analysis_tool_schema, get_ui_analysis_validator, validate_ui_analysis
+
+# Optional: check Claude's reports against UI_ANALYSIS_SCHEMA, with the
+# compiled fastjsonschema validator if installed, else with jsonschema
+try:
+    import fastjsonschema
+    SCHEMA_VALIDATOR = "fastjsonschema"
+except ImportError:
+    try:
+        import jsonschema  # noqa: F401
+        SCHEMA_VALIDATOR = "jsonschema"
+    except ImportError:
+        SCHEMA_VALIDATOR = None
 
 
 class UITrapsAnalyzer:
@@ -68,7 +80,8 @@ class UITrapsAnalyzer:
         user_context: Dict[str, str],
         timeout: int = 120,
         user_id: Optional[str] = None,
-        page_context: Optional[Dict[str, Any]] = None
+        page_context: Optional[Dict[str, Any]] = None,
+        user_message: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """
         Analyze a UI design using the UI Tenets & Traps framework.
@@ -84,6 +97,9 @@ class UITrapsAnalyzer:
                 - page_url: URL of this page
                 - site_pages: List of other page titles on the site
                 - relevant_tasks: Tasks appropriate for this page type
+            user_message: Optional pre-built user message content (e.g. from
+                make_frame_message_builder); when given, design_file is
+                only validated, not loaded
 
         Returns:
             Dictionary containing:
@@ -123,14 +139,14 @@ class UITrapsAnalyzer:
                 "Please export your Figma design as PNG/JPG and upload the image file. "
                 "Alternatively, integrate Figma API to fetch design images automatically."
             )
-        else:
+        elif user_message is None:
             # Load image and convert to base64 for Claude
             image_data = self._load_image(design_file)
             user_message = build_user_message(user_context, image_data, page_context)
 
         # Step 4: Call Claude API with structured output
         # Use tool forcing to ensure structured JSON output
-        schema = get_ui_analysis_schema()
+        schema = get_ui_analysis_tool_schema()
 
         try:
             response = self.client.messages.create(
@@ -208,6 +224,26 @@ class UITrapsAnalyzer:
                 f"Response content: {response.content}"
             )
 
+        # Step 5b: Check the report against the full schema. Mismatches are
+        # logged, not raised: the fixes above deliberately accept near-misses
+        # such as a single-string summary.
+        schema_errors = []
+        if SCHEMA_VALIDATOR == "fastjsonschema":
+            try:
+                validate_ui_analysis(report)
+            except fastjsonschema.JsonSchemaValueException as e:
+                schema_errors = [e.message]
+        elif SCHEMA_VALIDATOR == "jsonschema":
+            schema_errors = [
+                f"{error.json_path}: {error.message}"
+                for error in get_ui_analysis_validator().iter_errors(report)
+            ]
+        if schema_errors:
+            print(
+                f"[UITraps] Report does not match schema "
+                f"({len(schema_errors)} issue(s)): {'; '.join(schema_errors[:3])}"
+            )
+
         # Step 6: Calculate metadata
         duration = time.time() - start_time
 
@@ -5,7 +5,7 @@ Uses SQLModel (Pydantic + SQLAlchemy) for type-safe database operations.
 """
 
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 from pathlib import Path
 
@@ -13,6 +13,11 @@ from sqlmodel import Field, SQLModel, Session, create_engine
 from sqlalchemy import UniqueConstraint
 
 
+def utcnow() -> datetime:
+    """Current time in UTC, for created_at/updated_at columns."""
+    return datetime.now(timezone.utc)
+
+
 # --- Models ---
 
 class APIKey(SQLModel, table=True):
@@ -24,13 +29,16 @@ class APIKey(SQLModel, table=True):
     tier: str = Field(default="basic")
     monthly_limit: int = Field(default=20)
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
 
 class UsageRecord(SQLModel, table=True):
     """Monthly usage count per API key."""
     __tablename__ = "usage_records"
+    # The unique constraint is also the composite (api_key_id, month) index
+    # behind per-month usage lookups and the ON CONFLICT upsert in
+    # usage_service.increment_usage(); no separate Index is needed.
     __table_args__ = (
         UniqueConstraint("api_key_id", "month", name="unique_key_month"),
     )
@@ -39,8 +47,8 @@ class UsageRecord(SQLModel, table=True):
     api_key_id: int = Field(foreign_key="api_keys.id", index=True)
     month: str = Field(index=True)  # Format: YYYY-MM
     count: int = Field(default=0)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
 
 class AnalysisAudit(SQLModel, table=True):
@@ -54,7 +62,7 @@ class AnalysisAudit(SQLModel, table=True):
     credits_used: int = Field(default=1)
     status: str = Field(default="success")
     request_metadata: Optional[str] = None  # JSON string
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    created_at: datetime = Field(default_factory=utcnow, index=True)
 
 
 # --- Chat Models (for unified platform) ---
@@ -66,8 +74,8 @@ class ConversationSession(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     session_id: str = Field(unique=True, index=True)
     user_id: int = Field(index=True)  # From JWT payload
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
     last_analysis_summary: Optional[str] = None  # JSON string of last analysis
 
 
@@ -81,7 +89,7 @@ class ChatMessageRecord(SQLModel, table=True):
     content: str
     mode: Optional[str] = None  # "analysis" | "chat" | "hybrid"
     sources: Optional[str] = None  # JSON array of source URLs
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
 
 
 # --- Database Connection ---
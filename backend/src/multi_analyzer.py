@@ -95,7 +95,22 @@ def _load_image_as_base64(image_path: str) -> Optional[str]:
     except Exception as e:
         print(f"[UITraps DEBUG] Error loading image {image_path}: {type(e).__name__}: {e}")
         return None
-from .video_processor import VideoProcessor, is_ffmpeg_available
+
+
+def _image_block_from_data_url(data_url: str) -> Dict[str, Any]:
+    """Turn a data URL from _load_image_as_base64 into a Claude API image block."""
+    header, data = data_url.split(',', 1)
+    media_type = header.split(':', 1)[1].split(';', 1)[0]
+    return {
+        "type": "image",
+        "source": {
+            "type": "base64",
+            "media_type": media_type,
+            "data": data
+        }
+    }
+from .video_processor import VideoProcessor, is_ffmpeg_available, VIDEO_WORKER_ENABLED
+from .prompts import make_frame_message_builder
 from .formatters import format_report_as_html, format_report_as_markdown, get_report_statistics
 
 
@@ -121,6 +136,8 @@ class MultiAnalyzer:
         """Lazy-load video processor."""
         if self.video_processor is None:
             self.video_processor = VideoProcessor()
+            if VIDEO_WORKER_ENABLED and self.video_processor.ffmpeg_available:
+                self.video_processor.start_worker()
         return self.video_processor
 
     def _filter_frames_with_ai(
@@ -392,48 +409,57 @@ class MultiAnalyzer:
             if progress_callback:
                 progress_callback(0, 1, f"Selected {len(frames)} quality frames for analysis")
 
-        # Analyze each frame
-        results = []
+        # The shared prompt scaffold is built once; each frame's message is
+        # built inside the loop from that frame's single image load
         total = len(frames)
+        build_frame_message = make_frame_message_builder(user_context, total)
 
-        for i, (frame_path, timestamp) in enumerate(frames):
-            if progress_callback:
-                progress_callback(
-                    i + 1, total,
-                    f"Analyzing frame {i + 1} of {total} ({timestamp:.1f}s)"
-                )
-
-            # Load frame image as base64 BEFORE analysis (in case of error)
-            image_data = _load_image_as_base64(frame_path)
-
-            try:
-                result = self.analyzer.analyze_design(
-                    design_file=frame_path,
-                    user_context=user_context
-                )
-                results.append({
-                    'path': frame_path,
-                    'filename': f"Frame at {timestamp:.1f}s",
-                    'timestamp': timestamp,
-                    'index': i + 1,
-                    'result': result,
-                    'error': None,
-                    'image_data': image_data
-                })
-            except Exception as e:
-                results.append({
-                    'path': frame_path,
-                    'filename': f"Frame at {timestamp:.1f}s",
-                    'timestamp': timestamp,
-                    'index': i + 1,
-                    'result': None,
-                    'error': str(e),
-                    'image_data': image_data
-                })
+        # Analyze each frame
+        results = []
 
-        # Clean up all extracted frame files
-        all_frame_paths = [f[0] for f in frames]
-        processor.cleanup_frames(all_frame_paths)
+        try:
+            for i, (frame_path, timestamp) in enumerate(frames):
+                if progress_callback:
+                    progress_callback(
+                        i + 1, total,
+                        f"Analyzing frame {i + 1} of {total} ({timestamp:.1f}s)"
+                    )
+
+                # Load frame image as base64 BEFORE analysis (in case of error)
+                image_data = _load_image_as_base64(frame_path)
+
+                try:
+                    if not image_data:
+                        raise ValueError(f"Could not load frame image: {frame_path}")
+
+                    result = self.analyzer.analyze_design(
+                        design_file=frame_path,
+                        user_context=user_context,
+                        user_message=build_frame_message(_image_block_from_data_url(image_data), i + 1)
+                    )
+                    results.append({
+                        'path': frame_path,
+                        'filename': f"Frame at {timestamp:.1f}s",
+                        'timestamp': timestamp,
+                        'index': i + 1,
+                        'result': result,
+                        'error': None,
+                        'image_data': image_data
+                    })
+                except Exception as e:
+                    results.append({
+                        'path': frame_path,
+                        'filename': f"Frame at {timestamp:.1f}s",
+                        'timestamp': timestamp,
+                        'index': i + 1,
+                        'result': None,
+                        'error': str(e),
+                        'image_data': image_data
+                    })
+        finally:
+            # Clean up all extracted frame files
+            all_frame_paths = [f[0] for f in frames]
+            processor.cleanup_frames(all_frame_paths)
 
         # Aggregate results
         aggregated = self._aggregate_results(results, 'video')
@@ -18,7 +18,7 @@ class IntentMode(str, Enum):
     HYBRID = "hybrid"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IntentResult:
     mode: IntentMode
     message: Optional[str]
@@ -26,6 +26,26 @@ class IntentResult:
     has_context: bool
 
 
+# Minimum length (after stripping) for a context field to count as filled
+MIN_CONTEXT_LENGTH = 10
+
+
+def _is_nonblank(value: Optional[str]) -> bool:
+    """Check a string is non-empty and not all whitespace, without copying it."""
+    return bool(value) and not value.isspace()
+
+
+def _is_context_filled(value: Optional[str]) -> bool:
+    """Check a context field has at least MIN_CONTEXT_LENGTH characters once stripped."""
+    # The raw length check rejects short input before anything else; strip()
+    # (which copies the string) is only needed when the ends are whitespace.
+    if value is None or len(value) < MIN_CONTEXT_LENGTH:
+        return False
+    if not value[0].isspace() and not value[-1].isspace():
+        return True
+    return len(value.strip()) >= MIN_CONTEXT_LENGTH
+
+
 def detect_intent(
     message: Optional[str] = None,
     files: list | None = None,
@@ -52,18 +72,24 @@ def detect_intent(
     Returns:
         IntentResult with mode, message, and detection flags.
     """
-    if files is None:
-        files = []
-
-    has_files = len(files) > 0
-    has_message = bool(message and message.strip())
-    has_context = all([
-        users and len(users.strip()) >= 10,
-        tasks and len(tasks.strip()) >= 10,
-        format_desc and len(format_desc.strip()) >= 10,
-    ])
-
-    if has_files and has_context:
+    has_files = bool(files)
+
+    if not has_files:
+        # Text only → RAG chat (the common case; context fields are irrelevant)
+        return IntentResult(
+            mode=IntentMode.CHAT,
+            message=message,
+            has_files=False,
+            has_context=False,
+        )
+
+    has_context = (
+        _is_context_filled(users)
+        and _is_context_filled(tasks)
+        and _is_context_filled(format_desc)
+    )
+
+    if has_context:
         # Standard trap analysis with full context
         return IntentResult(
             mode=IntentMode.ANALYSIS,
@@ -72,7 +98,7 @@ def detect_intent(
             has_context=True,
         )
 
-    if has_files and has_message and not has_context:
+    if _is_nonblank(message):
         # Files + question but no structured context → hybrid
         return IntentResult(
             mode=IntentMode.HYBRID,
@@ -81,19 +107,10 @@ def detect_intent(
             has_context=False,
         )
 
-    if has_files and not has_message and not has_context:
-        # Files only, no context → basic analysis (will need context prompted)
-        return IntentResult(
-            mode=IntentMode.ANALYSIS,
-            message=None,
-            has_files=True,
-            has_context=False,
-        )
-
-    # Text only → RAG chat
+    # Files only, no context → basic analysis (will need context prompted)
     return IntentResult(
-        mode=IntentMode.CHAT,
-        message=message,
-        has_files=False,
+        mode=IntentMode.ANALYSIS,
+        message=None,
+        has_files=True,
         has_context=False,
     )
@@ -5,6 +5,14 @@ Copyright © 2009-present UI Traps LLC. All Rights Reserved.
 PROPRIETARY & CONFIDENTIAL - UI Tenets & Traps Framework
 """
 
+import copy
+from types import MappingProxyType
+
+
+# Compiled validators for UI_ANALYSIS_SCHEMA, built on first use
+_VALIDATOR = None
+_VALIDATE = None
+
 # JSON Schema for Claude's structured output
 # This ensures Claude always returns data in the exact format we expect
 UI_ANALYSIS_SCHEMA = {
@@ -196,11 +204,87 @@ UI_ANALYSIS_SCHEMA = {
 }
 
 
+def _freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Deeply read-only view of the schema handed out to callers, so the shared
+# schema cannot be modified through get_ui_analysis_schema() at any level
+_FROZEN_SCHEMA = _freeze(UI_ANALYSIS_SCHEMA)
+
+# Plain-dict copy for API payloads, which must be JSON serializable
+_TOOL_SCHEMA = copy.deepcopy(UI_ANALYSIS_SCHEMA)
+
+
 def get_ui_analysis_schema():
     """
     Get the JSON schema for UI analysis structured output.
 
     Returns:
-        Dictionary containing the JSON schema
+        Deeply read-only mapping containing the JSON schema (nested objects
+        are read-only mappings, arrays are tuples); the same object on
+        every call
+    """
+    return _FROZEN_SCHEMA
+
+
+def get_ui_analysis_tool_schema():
+    """
+    Get the JSON schema as plain dicts and lists, for the tool input_schema.
+
+    Returns:
+        JSON-serializable copy of the schema, shared between calls; treat it
+        as read-only
+    """
+    return _TOOL_SCHEMA
+
+
+def get_ui_analysis_validator():
+    """
+    Get a jsonschema validator for UI_ANALYSIS_SCHEMA.
+
+    The schema is checked and the validator built once, on first call;
+    later calls return the same instance. Requires the optional
+    jsonschema package.
+
+    Returns:
+        jsonschema validator instance (use .validate(doc) or .iter_errors(doc))
+    """
+    global _VALIDATOR
+    if _VALIDATOR is None:
+        from jsonschema import validators
+
+        cls = validators.validator_for(UI_ANALYSIS_SCHEMA)
+        cls.check_schema(UI_ANALYSIS_SCHEMA)
+        _VALIDATOR = cls(UI_ANALYSIS_SCHEMA)
+    return _VALIDATOR
+
+
+def validate_ui_analysis(doc):
+    """
+    Validate a UI analysis report against UI_ANALYSIS_SCHEMA.
+
+    Uses a fastjsonschema-generated validation function, compiled once on
+    first call. Much faster than get_ui_analysis_validator() but stops at
+    the first error. Requires the optional fastjsonschema package.
+
+    Args:
+        doc: Report data to validate
+
+    Returns:
+        The validated data (with schema defaults applied)
+
+    Raises:
+        fastjsonschema.JsonSchemaValueException: If the data is invalid
     """
-    return UI_ANALYSIS_SCHEMA
+    global _VALIDATE
+    if _VALIDATE is None:
+        import fastjsonschema
+
+        _VALIDATE = fastjsonschema.compile(UI_ANALYSIS_SCHEMA)
+    return _VALIDATE(doc)
@@ -8,12 +8,16 @@ Copyright © 2009-present UI Traps LLC. All Rights Reserved.
 """
 
 import os
+import re
 import time
-from typing import Dict, List, Any, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
 try:
     from .analyzer import UITrapsAnalyzer
+    from .formatters import get_report_statistics
     from .page_classifier import (
         classify_page,
         classify_all_pages,
@@ -23,6 +27,7 @@ try:
 except ImportError:
     # Fallback for direct script execution
     from analyzer import UITrapsAnalyzer
+    from formatters import get_report_statistics
     from page_classifier import (
         classify_page,
         classify_all_pages,
@@ -31,6 +36,41 @@ except ImportError:
     )
 
 
+# Separators between tasks in a free-text task list
+_TASK_SEP = re.compile(r"[;,\n]+")
+
+# Maximum number of pages analyzed concurrently (each is a Claude API call)
+_MAX_PAGE_WORKERS = 8
+
+# Severity levels paired with the report list that holds their issues
+_SEVERITY_MAP = (
+    ("critical", "critical_issues"),
+    ("moderate", "moderate_issues"),
+    ("minor", "minor_issues")
+)
+
+# Sort rank for recommendations (critical first)
+_SEVERITY_ORDER = {"critical": 0, "moderate": 1, "minor": 2}
+
+# Report keys holding issue lists
+_ISSUE_LISTS = ("critical_issues", "moderate_issues", "minor_issues")
+
+# Page roles not worth an API call unless a task targets them directly
+_PERIPHERAL_ROLES = frozenset(("legal",))
+
+def _skipped_page_report() -> Dict[str, Any]:
+    """Build the report used in place of an analysis for a skipped peripheral page."""
+    return {
+        "summary": ["Page skipped - no relevant tasks"],
+        "critical_issues": [],
+        "moderate_issues": [],
+        "minor_issues": [],
+        "positive_observations": [],
+        "potential_issues": [],
+        "traps_checked_not_found": []
+    }
+
+
 class SiteAnalyzer:
     """
     Orchestrates UI Traps analysis across multiple pages of a website.
@@ -53,6 +93,9 @@ class SiteAnalyzer:
         self.page_classifications = {}
         self.page_analyses = []
         self.flow_analyses = []
+        self._roles_found = frozenset()
+        self._issues_flat = []
+        self._aggregate_cache = None
 
     def analyze_site(
         self,
@@ -106,6 +149,7 @@ class SiteAnalyzer:
             progress_callback(0, len(pages) + 2, "Classifying page roles...")
 
         self.page_classifications = classify_all_pages(pages)
+        self._roles_found = frozenset(info["role"] for info in self.page_classifications.values())
 
         # Step 2: Analyze task flows
         if progress_callback:
@@ -113,21 +157,43 @@ class SiteAnalyzer:
 
         self.flow_analyses = generate_flow_analysis(tasks, self.page_classifications)
 
-        # Step 3: Analyze each page with context
-        self.page_analyses = []
-        site_page_titles = [p.get("title", "Unknown") for p in pages]
+        # Step 3: Analyze each page with context. Pages are independent,
+        # network-bound API calls, so run them concurrently; results keep
+        # the input page order.
+        self.page_analyses = [None] * len(pages)
+        self._aggregate_cache = None
+        # Context fields that are the same for every page
+        base_user_context = {
+            "users": user_context.get("users", ""),
+            "format": user_context.get("format", "PNG screenshot")
+        }
+
+        # Unique titles in crawl order, shared (immutable) by every page prompt
+        site_page_titles = tuple(dict.fromkeys(p.get("title", "Unknown") for p in pages))
+        completed = 0
+
+        if pages:
+            with ThreadPoolExecutor(max_workers=min(_MAX_PAGE_WORKERS, len(pages))) as executor:
+                futures = {
+                    executor.submit(
+                        self._analyze_page_with_context,
+                        page=page,
+                        base_user_context=base_user_context,
+                        tasks=tasks,
+                        site_page_titles=site_page_titles
+                    ): (i, page)
+                    for i, page in enumerate(pages)
+                }
 
-        for i, page in enumerate(pages):
-            if progress_callback:
-                progress_callback(i + 2, len(pages) + 2, f"Analyzing: {page.get('title', 'Unknown')}")
+                for future in as_completed(futures):
+                    i, page = futures[future]
+                    self.page_analyses[i] = future.result()
 
-            page_result = self._analyze_page_with_context(
-                page=page,
-                user_context=user_context,
-                tasks=tasks,
-                site_page_titles=site_page_titles
-            )
-            self.page_analyses.append(page_result)
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed + 1, len(pages) + 2, f"Analyzed: {page.get('title', 'Unknown')}")
+
+        self._issues_flat = self._flatten_issues()
 
         # Step 4: Generate aggregate statistics
         statistics = self._calculate_statistics()
@@ -161,25 +227,24 @@ class SiteAnalyzer:
             return tasks
         if isinstance(tasks, str):
             # Split by newlines or common separators
-            lines = tasks.replace(";", "\n").replace(",", "\n").split("\n")
-            return [t.strip() for t in lines if t.strip()]
+            return [t.strip() for t in _TASK_SEP.split(tasks) if t.strip()]
         return []
 
     def _analyze_page_with_context(
         self,
         page: Dict,
-        user_context: Dict,
+        base_user_context: Dict[str, str],
         tasks: List[str],
-        site_page_titles: List[str]
+        site_page_titles: Tuple[str, ...]
     ) -> Dict[str, Any]:
         """
         Analyze a single page with full context awareness.
 
         Args:
             page: Page dict with url, title, screenshot_path
-            user_context: Original user context
+            base_user_context: "users" and "format" from the original user context
             tasks: Parsed list of tasks
-            site_page_titles: Titles of all pages on site
+            site_page_titles: Unique titles of all pages on site
 
         Returns:
             Analysis result dict
@@ -195,6 +260,23 @@ class SiteAnalyzer:
         # Get relevant tasks for this page type
         relevant_tasks = get_relevant_tasks(page_role, tasks)
 
+        # Skip the API call for peripheral pages (privacy, terms, ...) that
+        # no task targets. Unmatched tasks land in "partial" by default, so
+        # only "full" matches count as relevant here.
+        if page_role in _PERIPHERAL_ROLES and not relevant_tasks.get("full"):
+            report = _skipped_page_report()
+            return {
+                "page": page,
+                "page_role": page_role,
+                "relevant_tasks": relevant_tasks,
+                "analysis": {
+                    "report": report,
+                    "statistics": get_report_statistics(report)
+                },
+                "success": True,
+                "skipped": True
+            }
+
         # Build task description for this page
         task_description = self._build_task_description(relevant_tasks, page_role)
 
@@ -208,11 +290,7 @@ class SiteAnalyzer:
         }
 
         # Build modified user context
-        modified_context = {
-            "users": user_context.get("users", ""),
-            "tasks": task_description,
-            "format": user_context.get("format", "PNG screenshot")
-        }
+        modified_context = {**base_user_context, "tasks": task_description}
 
         try:
             # Run analysis with page context
@@ -263,98 +341,113 @@ class SiteAnalyzer:
 
         return "\n".join(lines)
 
-    def _calculate_statistics(self) -> Dict[str, Any]:
-        """Calculate aggregate statistics across all pages."""
+    def _flatten_issues(self) -> List[Tuple[str, str, str, Dict[str, Any]]]:
+        """
+        Flatten the issues of all successful pages into one list.
+
+        Returns:
+            (page_title, severity, trap_name, issue) tuples in page order,
+            critical issues first within each page
+        """
+        issues = []
+        for page_result in self.page_analyses:
+            if not page_result.get("success"):
+                continue
+
+            page_title = (page_result.get("page") or {}).get("title", "Unknown")
+            report = (page_result.get("analysis") or {}).get("report") or {}
+
+            for severity, issue_list in _SEVERITY_MAP:
+                for issue in report.get(issue_list, []):
+                    issues.append((page_title, severity, issue.get("trap_name", "Unknown"), issue))
+        return issues
+
+    def _aggregate(self) -> Dict[str, Any]:
+        """
+        Aggregate statistics and recommendations across all pages.
+
+        Per-page counts come from each analysis' statistics; trap frequency
+        and recommendations come from one scan of the flattened issue list.
+        The result is cached until page_analyses is rebuilt by analyze_site().
+
+        Returns:
+            Dict with "statistics" and "recommendations"
+        """
+        if self._aggregate_cache is not None:
+            return self._aggregate_cache
+
         total_critical = 0
         total_moderate = 0
         total_minor = 0
         total_positive = 0
-        trap_frequency = {}
+        pages_successful = 0
 
         for page_result in self.page_analyses:
             if not page_result.get("success"):
                 continue
+            pages_successful += 1
 
-            analysis = page_result.get("analysis") or {}
-            stats = analysis.get("statistics") or {}
-            report = analysis.get("report") or {}
-
+            stats = (page_result.get("analysis") or {}).get("statistics") or {}
             total_critical += stats.get("critical_count", 0)
             total_moderate += stats.get("moderate_count", 0)
             total_minor += stats.get("minor_count", 0)
             total_positive += stats.get("positive_count", 0)
 
-            # Count trap frequency
-            for issue_list in ["critical_issues", "moderate_issues", "minor_issues"]:
-                for issue in report.get(issue_list, []):
-                    trap_name = issue.get("trap_name", "Unknown")
-                    trap_frequency[trap_name] = trap_frequency.get(trap_name, 0) + 1
-
-        # Sort traps by frequency
-        sorted_traps = sorted(trap_frequency.items(), key=lambda x: x[1], reverse=True)
-
-        return {
-            "total_issues": total_critical + total_moderate + total_minor,
-            "critical_count": total_critical,
-            "moderate_count": total_moderate,
-            "minor_count": total_minor,
-            "positive_count": total_positive,
-            "pages_analyzed": len(self.page_analyses),
-            "pages_successful": sum(1 for p in self.page_analyses if p.get("success")),
-            "trap_frequency": dict(sorted_traps),
-            "most_common_traps": sorted_traps[:5]
-        }
+        # Count trap frequency
+        trap_frequency = Counter(trap_name for _, _, trap_name, _ in self._issues_flat)
 
-    def _generate_recommendations(self) -> List[Dict[str, Any]]:
-        """Generate prioritized recommendations from all analyses."""
         recommendations = []
         seen = set()
-
-        # Collect all issues with context
-        for page_result in self.page_analyses:
-            if not page_result.get("success"):
+        for page_title, severity, _, issue in self._issues_flat:
+            # Create unique key to avoid duplicate recommendations
+            key = (issue.get("trap_name"), (issue.get("recommendation") or "")[:50])
+            if key in seen:
                 continue
+            seen.add(key)
 
-            page_title = (page_result.get("page") or {}).get("title", "Unknown")
-            analysis = page_result.get("analysis") or {}
-            report = analysis.get("report") or {}
-
-            for severity, issue_list in [
-                ("critical", "critical_issues"),
-                ("moderate", "moderate_issues"),
-                ("minor", "minor_issues")
-            ]:
-                for issue in report.get(issue_list, []):
-                    # Create unique key to avoid duplicates
-                    key = f"{issue.get('trap_name')}:{issue.get('recommendation', '')[:50]}"
-                    if key in seen:
-                        continue
-                    seen.add(key)
-
-                    recommendations.append({
-                        "severity": severity,
-                        "trap_name": issue.get("trap_name"),
-                        "recommendation": issue.get("recommendation"),
-                        "page": page_title,
-                        "location": issue.get("location"),
-                        "problem": issue.get("problem")
-                    })
+            recommendations.append({
+                "severity": severity,
+                "trap_name": issue.get("trap_name"),
+                "recommendation": issue.get("recommendation"),
+                "page": page_title,
+                "location": issue.get("location"),
+                "problem": issue.get("problem")
+            })
 
         # Sort by severity (critical first, then moderate, then minor)
-        severity_order = {"critical": 0, "moderate": 1, "minor": 2}
-        recommendations.sort(key=lambda x: severity_order.get(x["severity"], 3))
+        recommendations.sort(key=lambda x: _SEVERITY_ORDER.get(x["severity"], 3))
+
+        self._aggregate_cache = {
+            "statistics": {
+                "total_issues": total_critical + total_moderate + total_minor,
+                "critical_count": total_critical,
+                "moderate_count": total_moderate,
+                "minor_count": total_minor,
+                "positive_count": total_positive,
+                "pages_analyzed": len(self.page_analyses),
+                "pages_successful": pages_successful,
+                "trap_frequency": dict(trap_frequency.most_common()),
+                "most_common_traps": trap_frequency.most_common(5)
+            },
+            "recommendations": recommendations
+        }
+        return self._aggregate_cache
+
+    def _calculate_statistics(self) -> Dict[str, Any]:
+        """Calculate aggregate statistics across all pages."""
+        return self._aggregate()["statistics"]
 
-        return recommendations
+    def _generate_recommendations(self) -> List[Dict[str, Any]]:
+        """Generate prioritized recommendations from all analyses."""
+        return self._aggregate()["recommendations"]
 
     def _generate_site_summary(self, tasks: List[str]) -> Dict[str, Any]:
         """Generate overall site summary."""
         # Check flow completeness
         incomplete_flows = [f for f in self.flow_analyses if not f.get("complete")]
 
-        # Get page role coverage
-        roles_found = set(info["role"] for info in self.page_classifications.values())
-
-        # Identify site-wide issues (appear on multiple pages)
+        # Identify site-wide issues (appear on multiple pages); reuses the
+        # aggregation already computed by analyze_site()
         stats = self._calculate_statistics()
         sitewide_issues = [
             {"trap": trap, "count": count}
@@ -379,7 +472,7 @@ class SiteAnalyzer:
             "moderate_count": stats["moderate_count"],
             "minor_count": stats["minor_count"],
             "positive_count": stats["positive_count"],
-            "page_roles_found": list(roles_found),
+            "page_roles_found": list(self._roles_found),
             "incomplete_task_flows": [
                 {
                     "task": f["task"],
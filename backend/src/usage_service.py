@@ -4,22 +4,136 @@ Usage tracking service - replaces in-memory dict.
 All database operations for usage tracking, API key management, and audit logging.
 """
 
+import atexit
 import json
+import logging
+import queue
+import threading
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from sqlmodel import Session, select
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
-from src.database import APIKey, UsageRecord, AnalysisAudit
+from src.database import APIKey, UsageRecord, AnalysisAudit, engine, utcnow
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        """Serialize audit metadata to compact JSON (orjson)."""
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        """Serialize audit metadata to compact JSON (stdlib fallback)."""
+        return json.dumps(obj, separators=(",", ":"))
+
+
+logger = logging.getLogger(__name__)
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT ... DO UPDATE
+_UPSERT_INSERTS = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
+
+# Current month string, recomputed at most once a minute
+_MONTH_CACHE_TTL = 60.0
+_MONTH_CACHE = {"expires": 0.0, "value": ""}
+
+# Hot-path usage read: fetch just the count, without hydrating a UsageRecord
+_USAGE_COUNT_SQL = text(
+    "SELECT count FROM usage_records WHERE api_key_id = :api_key_id AND month = :month"
+)
+
+# In-process cache of APIKey rows: key string -> (expiry time, detached copy).
+# Nothing in this service changes APIKey rows after creating them, so edits
+# made directly in the database (deactivating a key, changing its
+# monthly_limit or tier) take effect once the cached copy expires: up to
+# _KEY_CACHE_TTL seconds later, per process. Call invalidate_api_key_cache()
+# after such an edit to apply it immediately.
+_KEY_CACHE_TTL = 60.0
+_KEY_CACHE: Dict[str, Tuple[float, APIKey]] = {}
+
+
+# Audit rows waiting to be written by the background writer thread, which
+# commits them in batches of up to _AUDIT_BATCH_SIZE every
+# _AUDIT_FLUSH_INTERVAL seconds
+_AUDIT_BATCH_SIZE = 100
+_AUDIT_FLUSH_INTERVAL = 0.5
+_AUDIT_QUEUE: "queue.Queue[AnalysisAudit]" = queue.Queue()
+_AUDIT_WRITER: Optional[threading.Thread] = None
+_AUDIT_WRITER_LOCK = threading.Lock()
 
 
 def get_current_month() -> str:
-    """Get current month in YYYY-MM format."""
-    return datetime.now().strftime("%Y-%m")
+    """
+    Get current month in YYYY-MM format.
+
+    The value is recomputed at most once every _MONTH_CACHE_TTL seconds.
+    """
+    now = time.monotonic()
+    if now >= _MONTH_CACHE["expires"]:
+        _MONTH_CACHE["value"] = datetime.now().strftime("%Y-%m")
+        _MONTH_CACHE["expires"] = now + _MONTH_CACHE_TTL
+    return _MONTH_CACHE["value"]
 
 
 # --- API Key Operations ---
 
+def _cache_api_key(db_key: APIKey) -> APIKey:
+    """Store a detached copy of an APIKey row in the cache and return it."""
+    cached = APIKey(
+        id=db_key.id,
+        key=db_key.key,
+        tier=db_key.tier,
+        monthly_limit=db_key.monthly_limit,
+        is_active=db_key.is_active,
+        created_at=db_key.created_at,
+        updated_at=db_key.updated_at
+    )
+    _KEY_CACHE[cached.key] = (time.monotonic() + _KEY_CACHE_TTL, cached)
+    return cached
+
+
+def _get_api_key(session: Session, api_key: str) -> Optional[APIKey]:
+    """
+    Look up an API key, serving repeat lookups from the in-process cache.
+
+    Rows are cached for _KEY_CACHE_TTL seconds as detached copies (safe to
+    read after the session closes). Missing keys are not cached.
+    """
+    entry = _KEY_CACHE.get(api_key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    db_key = session.exec(
+        select(APIKey).where(APIKey.key == api_key)
+    ).first()
+
+    if not db_key:
+        _KEY_CACHE.pop(api_key, None)
+        return None
+
+    return _cache_api_key(db_key)
+
+
+def invalidate_api_key_cache(api_key: Optional[str] = None):
+    """
+    Drop cached APIKey rows after a key is changed outside this module.
+
+    Args:
+        api_key: Key to drop, or None to clear the whole cache
+    """
+    if api_key is None:
+        _KEY_CACHE.clear()
+    else:
+        _KEY_CACHE.pop(api_key, None)
+
+
 def get_or_create_api_key(session: Session, api_key: str, default_limit: int = 20) -> APIKey:
     """
     Get existing API key or create a new one.
@@ -27,14 +141,14 @@ def get_or_create_api_key(session: Session, api_key: str, default_limit: int = 2
     For backward compatibility with VALID_API_KEYS env var,
     auto-creates keys in the database when first seen.
     """
-    statement = select(APIKey).where(APIKey.key == api_key)
-    db_key = session.exec(statement).first()
+    db_key = _get_api_key(session, api_key)
 
     if not db_key:
         db_key = APIKey(key=api_key, monthly_limit=default_limit)
         session.add(db_key)
         session.commit()
         session.refresh(db_key)
+        db_key = _cache_api_key(db_key)
 
     return db_key
 
@@ -54,9 +168,7 @@ def verify_api_key_db(session: Session, api_key: str, valid_keys: set) -> bool:
         return False
 
     # Check if key exists and is active in DB
-    db_key = session.exec(
-        select(APIKey).where(APIKey.key == api_key)
-    ).first()
+    db_key = _get_api_key(session, api_key)
 
     # If not in DB yet, it's valid (will be created on first use)
     if not db_key:
@@ -65,11 +177,37 @@ def verify_api_key_db(session: Session, api_key: str, valid_keys: set) -> bool:
     return db_key.is_active
 
 
+def verify_and_load(
+    session: Session,
+    api_key: str,
+    valid_keys: set
+) -> Tuple[bool, Optional[APIKey]]:
+    """
+    Verify an API key and load its APIKey row with a single (cached) lookup.
+
+    Same rules as verify_api_key_db(). The returned row gives callers the
+    monthly limit without a separate get_monthly_limit() call.
+
+    Returns:
+        (is_valid, db_key) - db_key is None if the key is not in the DB yet
+        (or was rejected by VALID_API_KEYS)
+    """
+    # Check env var first (no keys configured = development mode, allow all)
+    if valid_keys and api_key not in valid_keys:
+        return False, None
+
+    db_key = _get_api_key(session, api_key)
+
+    # If not in DB yet, it's valid (will be created on first use)
+    if not valid_keys or not db_key:
+        return True, db_key
+
+    return db_key.is_active, db_key
+
+
 def get_monthly_limit(session: Session, api_key: str, default_limit: int) -> int:
     """Get monthly limit for an API key (supports tiered limits)."""
-    db_key = session.exec(
-        select(APIKey).where(APIKey.key == api_key)
-    ).first()
+    db_key = _get_api_key(session, api_key)
 
     if db_key:
         return db_key.monthly_limit
@@ -83,36 +221,59 @@ def get_usage(session: Session, api_key: str) -> int:
     """Get usage count for current month."""
     current_month = get_current_month()
 
-    db_key = session.exec(
-        select(APIKey).where(APIKey.key == api_key)
-    ).first()
+    db_key = _get_api_key(session, api_key)
 
     if not db_key:
         return 0
 
-    usage = session.exec(
-        select(UsageRecord).where(
-            UsageRecord.api_key_id == db_key.id,
-            UsageRecord.month == current_month
-        )
-    ).first()
+    count = session.scalar(
+        _USAGE_COUNT_SQL,
+        {"api_key_id": db_key.id, "month": current_month}
+    )
 
-    return usage.count if usage else 0
+    return count or 0
 
 
-def increment_usage(session: Session, api_key: str, amount: int = 1, default_limit: int = 20) -> int:
+def increment_usage(
+    session: Session,
+    api_key: str,
+    amount: int = 1,
+    default_limit: int = 20,
+    db_key: Optional[APIKey] = None
+) -> int:
     """
     Increment usage count for current month.
 
     Returns the new count after incrementing.
     Auto-creates API key and usage record if needed.
+    Pass db_key when the APIKey row is already loaded to skip looking it up.
     """
     current_month = get_current_month()
 
     # Get or create API key
-    db_key = get_or_create_api_key(session, api_key, default_limit)
+    if db_key is None:
+        db_key = get_or_create_api_key(session, api_key, default_limit)
+
+    insert = _UPSERT_INSERTS.get(session.get_bind().dialect.name)
+    if insert is not None:
+        # Atomic upsert: one statement, no read-modify-write race
+        stmt = insert(UsageRecord).values(
+            api_key_id=db_key.id,
+            month=current_month,
+            count=amount
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["api_key_id", "month"],
+            set_={
+                "count": UsageRecord.count + stmt.excluded.count,
+                "updated_at": utcnow()
+            }
+        ).returning(UsageRecord.count)
+        new_count = session.execute(stmt).scalar_one()
+        session.commit()
+        return new_count
 
-    # Get or create usage record
+    # Other databases: get or create usage record
     usage = session.exec(
         select(UsageRecord).where(
             UsageRecord.api_key_id == db_key.id,
@@ -122,7 +283,7 @@ def increment_usage(session: Session, api_key: str, amount: int = 1, default_lim
 
     if usage:
         usage.count += amount
-        usage.updated_at = datetime.utcnow()
+        usage.updated_at = utcnow()
     else:
         usage = UsageRecord(
             api_key_id=db_key.id,
@@ -139,6 +300,56 @@ def increment_usage(session: Session, api_key: str, amount: int = 1, default_lim
 
 # --- Audit Operations ---
 
+def _audit_writer_loop():
+    """Drain the audit queue, committing queued rows in batches."""
+    while True:
+        batch = [_AUDIT_QUEUE.get()]
+        deadline = time.monotonic() + _AUDIT_FLUSH_INTERVAL
+        while len(batch) < _AUDIT_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_AUDIT_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        try:
+            with Session(engine) as session:
+                session.add_all(batch)
+                session.commit()
+        except Exception as e:
+            logger.error(f"Failed to write {len(batch)} audit log entries: {e}")
+        finally:
+            for _ in batch:
+                _AUDIT_QUEUE.task_done()
+
+
+def _ensure_audit_writer():
+    """Start the background audit writer thread if it is not running."""
+    global _AUDIT_WRITER
+    if _AUDIT_WRITER is not None and _AUDIT_WRITER.is_alive():
+        return
+    with _AUDIT_WRITER_LOCK:
+        if _AUDIT_WRITER is None or not _AUDIT_WRITER.is_alive():
+            _AUDIT_WRITER = threading.Thread(
+                target=_audit_writer_loop,
+                name="audit-writer",
+                daemon=True
+            )
+            _AUDIT_WRITER.start()
+
+
+def flush_audit_log():
+    """Block until every queued audit entry has been written."""
+    if _AUDIT_WRITER is not None:
+        _AUDIT_QUEUE.join()
+
+
+# Write out pending audit entries before the interpreter exits
+atexit.register(flush_audit_log)
+
+
 def log_analysis(
     session: Session,
     api_key: str,
@@ -146,15 +357,23 @@ def log_analysis(
     analysis_type: str,
     credits_used: int,
     status: str = "success",
-    metadata: Optional[dict] = None
+    metadata: Optional[dict] = None,
+    db_key: Optional[APIKey] = None
 ):
-    """Log an analysis request to the audit trail."""
-    db_key = session.exec(
-        select(APIKey).where(APIKey.key == api_key)
-    ).first()
+    """
+    Log an analysis request to the audit trail.
 
-    if not db_key:
-        # Should not happen in normal flow, but handle gracefully
+    The entry is queued and committed in a batch by a background thread, so
+    this does not wait on the database write. Audit rows are eventually
+    consistent: they are written in the writer's own session, are not part
+    of the caller's transaction, and only become visible to queries once
+    written; call flush_audit_log() to wait for pending entries.
+
+    session is only used to look up (or create) the APIKey row when db_key
+    is not passed; pass db_key when the row is already loaded to skip that.
+    """
+    if db_key is None:
+        # Creating the key should not happen in normal flow, but handle gracefully
         db_key = get_or_create_api_key(session, api_key)
 
     audit = AnalysisAudit(
@@ -163,7 +382,7 @@ def log_analysis(
         analysis_type=analysis_type,
         credits_used=credits_used,
         status=status,
-        request_metadata=json.dumps(metadata) if metadata else None
+        request_metadata=_dumps(metadata) if metadata else None
     )
-    session.add(audit)
-    session.commit()
+    _ensure_audit_writer()
+    _AUDIT_QUEUE.put(audit)
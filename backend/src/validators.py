@@ -2,27 +2,35 @@
 File format validation for UI Traps Analyzer
 """
 import os
-from typing import Tuple
-from urllib.parse import urlparse
+import re
+from typing import Optional, Tuple
 
 
 SUPPORTED_IMAGE_FORMATS = {'.png', '.jpg', '.jpeg'}
 SUPPORTED_VIDEO_FORMATS = {'.mp4'}
 SUPPORTED_FORMATS = SUPPORTED_IMAGE_FORMATS | SUPPORTED_VIDEO_FORMATS
 
+# Only inputs starting with one of these can be Figma URLs
+_URL_PREFIXES = ('http://', 'https://')
+
+# Figma file links: (www.)figma.com host with a /file/ path segment
+_FIGMA_RE = re.compile(r'(?i:https?)://(?:www\.)?figma\.com/(?:[^?#]*/)?file/')
+
 
 def validate_file_format(file_path: str) -> Tuple[bool, str]:
     """
     Validate if file format is supported.
 
     Args:
-        file_path: Path to file or Figma URL
+        file_path: Path to file (str or path-like) or Figma URL
 
     Returns:
         Tuple of (is_valid, message)
     """
-    # Check if it's a Figma URL
-    if is_figma_url(file_path):
+    file_path = os.fspath(file_path)
+
+    # Check if it's a Figma URL (skip URL parsing for plain file paths)
+    if file_path[:8].lower().startswith(_URL_PREFIXES) and is_figma_url(file_path):
         return True, "Figma URL detected"
 
     # Check file extension first (before existence check)
@@ -37,7 +45,7 @@ def validate_file_format(file_path: str) -> Tuple[bool, str]:
         )
 
     # Check if file exists
-    if not os.path.exists(file_path):
+    if stat_or_none(file_path) is None:
         return False, f"File not found: {file_path}"
 
     # File exists and format is valid
@@ -59,11 +67,7 @@ def is_figma_url(url: str) -> bool:
     Returns:
         True if valid Figma URL
     """
-    try:
-        parsed = urlparse(url)
-        return parsed.netloc in ['figma.com', 'www.figma.com'] and '/file/' in parsed.path
-    except:
-        return False
+    return bool(_FIGMA_RE.match(url)) if isinstance(url, str) else False
 
 
 def validate_context(user_context: dict) -> Tuple[bool, str]:
@@ -107,9 +111,25 @@ def get_file_size(file_path: str) -> int:
     Returns:
         File size in bytes
     """
-    if not os.path.exists(file_path):
-        return 0
-    return os.path.getsize(file_path)
+    st = stat_or_none(file_path)
+    return st.st_size if st is not None else 0
+
+
+def stat_or_none(file_path: str) -> Optional[os.stat_result]:
+    """
+    Stat a file with a single syscall.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        os.stat() result, or None if the file does not exist or cannot be
+        accessed (the cases where os.path.exists() returns False)
+    """
+    try:
+        return os.stat(file_path)
+    except (OSError, ValueError):
+        return None
 
 
 def get_format_conversion_help(current_format: str) -> str:
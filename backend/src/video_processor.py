@@ -8,13 +8,139 @@ Copyright © 2009-present UI Traps LLC. All Rights Reserved.
 """
 
 import os
+import queue
+import re
 import subprocess
 import tempfile
 import shutil
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import BinaryIO, Dict, Iterator, List, Tuple, Optional
 import json
 
+try:
+    # Optional: in-process decoding without spawning ffmpeg (pip install av)
+    import av
+    import numpy as np
+    PYAV_AVAILABLE = True
+except ImportError:
+    PYAV_AVAILABLE = False
+
+
+# JPEG start/end-of-image markers delimiting frames in an MJPEG stream
+_JPEG_SOI = b'\xff\xd8'
+_JPEG_EOI = b'\xff\xd9'
+
+# Bytes read from the ffmpeg stdout pipe at a time
+_PIPE_READ_SIZE = 1 << 16
+
+# Presentation time of a frame in ffmpeg showinfo filter output (stderr)
+_PTS_TIME_RE = re.compile(rb'pts_time:\s*(-?[\d.]+)')
+# showinfo@v<i> lines from a multi-input run, tagged with the input index
+_BATCH_PTS_TIME_RE = re.compile(rb'\[showinfo@v(\d+) @ [^\]]*\].*?pts_time:\s*(-?[\d.]+)')
+
+# Hardware-accelerated decoding: "off" (default), "auto" to pick the best
+# method ffmpeg supports, or a specific method such as "cuda"
+HWACCEL_MODE = os.environ.get("UITRAPS_HWACCEL", "off").lower()
+
+# Hardware decoders in order of preference for "auto"
+_HWACCEL_PRIORITY = ('cuda', 'qsv', 'videotoolbox', 'vaapi')
+
+
+@lru_cache(maxsize=8)
+def _detect_hwaccels(ffmpeg_path: str) -> frozenset:
+    """Return the hwaccel methods an ffmpeg build supports (probed once per binary)."""
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, '-hide_banner', '-hwaccels'],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return frozenset()
+    # Output is a "Hardware acceleration methods:" header, then one per line
+    return frozenset(line.strip() for line in result.stdout.splitlines()[1:] if line.strip())
+
+
+# ffmpeg's lambda scale for JPEG quality (FF_QP2LAMBDA): -q:v N == N * 118
+_FF_QP2LAMBDA = 118
+
+
+# Persistent extraction worker (see VideoProcessor.start_worker).
+# Off by default; set UITRAPS_VIDEO_WORKER=true to enable.
+VIDEO_WORKER_ENABLED = os.environ.get("UITRAPS_VIDEO_WORKER", "").lower() == "true"
+
+# Maximum queued videos decoded by one worker ffmpeg invocation
+_WORKER_BATCH_SIZE = 8
+
+# Queue sentinel telling the worker thread to exit
+_WORKER_STOP = object()
+
+
+def _list_frame_files(output_dir: str, prefix: str, suffix: str) -> List[Path]:
+    """
+    List frame files in a directory with a single scandir, sorted by name.
+
+    Args:
+        output_dir: Directory ffmpeg wrote frames into
+        prefix: Filename prefix, e.g. 'frame_'
+        suffix: Filename extension, e.g. '.jpg'
+
+    Returns:
+        Sorted paths of matching files
+    """
+    with os.scandir(output_dir) as entries:
+        return sorted(
+            Path(entry.path) for entry in entries
+            if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+        )
+
+
+@dataclass
+class _ExtractionJob:
+    """A scene-detection request queued for the extraction worker."""
+    video_path: Path
+    output_dir: str
+    scene_threshold: float
+    max_frames: int
+    future: Future = field(default_factory=Future)
+
+
+def _iter_mjpeg(stream: BinaryIO) -> Iterator[bytes]:
+    """
+    Split an MJPEG byte stream (ffmpeg image2pipe output) into JPEG images.
+
+    Args:
+        stream: Binary stream such as a subprocess stdout pipe
+
+    Yields:
+        Each complete JPEG image, in stream order
+    """
+    buf = bytearray()
+    scan_from = 0
+    while True:
+        chunk = stream.read1(_PIPE_READ_SIZE)
+        if not chunk:
+            return
+        buf += chunk
+
+        while True:
+            end = buf.find(_JPEG_EOI, scan_from)
+            if end < 0:
+                # Resume the search where this one stopped (minus one byte
+                # in case a marker is split across reads)
+                scan_from = max(len(buf) - 1, 0)
+                break
+            start = buf.find(_JPEG_SOI, 0, end)
+            if start >= 0:
+                yield bytes(buf[start:end + 2])
+            del buf[:end + 2]
+            scan_from = 0
+
 
 class VideoProcessor:
     """
@@ -36,7 +162,12 @@ class VideoProcessor:
     # Minimum frames to ensure coverage
     MIN_FRAMES = 3
 
-    def __init__(self, ffmpeg_path: str = None, require_ffmpeg: bool = False):
+    def __init__(
+        self,
+        ffmpeg_path: str = None,
+        require_ffmpeg: bool = False,
+        ffprobe_path: str = None
+    ):
         """
         Initialize the video processor.
 
@@ -44,10 +175,20 @@ class VideoProcessor:
             ffmpeg_path: Path to ffmpeg binary. If None, uses system ffmpeg.
             require_ffmpeg: If True, raises error when FFmpeg not found.
                            If False, sets ffmpeg_available = False.
+            ffprobe_path: Path to ffprobe binary. If None, uses system ffprobe.
         """
         self.ffmpeg_path = ffmpeg_path or self._find_ffmpeg()
-        self.ffprobe_path = self._find_ffprobe()
+        self.ffprobe_path = ffprobe_path or self._find_ffprobe()
         self.ffmpeg_available = self.ffmpeg_path is not None and self.ffprobe_path is not None
+        self.hwaccel = self._select_hwaccel() if self.ffmpeg_available else None
+
+        # ffprobe results: absolute path -> (mtime_ns, info)
+        self._info_cache: Dict[str, Tuple[int, dict]] = {}
+
+        # Persistent extraction worker, started by start_worker()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_jobs: "queue.Queue" = queue.Queue()
+        self._worker_lock = threading.Lock()
 
         if require_ffmpeg and not self.ffmpeg_available:
             raise RuntimeError(
@@ -65,6 +206,48 @@ class VideoProcessor:
         """Find ffprobe in system PATH. Returns None if not found."""
         return shutil.which('ffprobe')
 
+    def _select_hwaccel(self) -> Optional[str]:
+        """Pick the hwaccel method to decode with, per UITRAPS_HWACCEL."""
+        if HWACCEL_MODE in ('', 'off', 'none'):
+            return None
+        available = _detect_hwaccels(self.ffmpeg_path)
+        if HWACCEL_MODE == 'auto':
+            return next((m for m in _HWACCEL_PRIORITY if m in available), None)
+        return HWACCEL_MODE if HWACCEL_MODE in available else None
+
+    def _hwaccel_input_args(self) -> List[str]:
+        """FFmpeg options to place before each -i for hardware decoding."""
+        if self.hwaccel is None:
+            return []
+        if self.hwaccel == 'cuda':
+            # Keep frames on the GPU; _hwaccel_filter() downloads the ones
+            # that reach the filter graph
+            return ['-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda']
+        # Other methods hand decoded frames back in system memory
+        return ['-hwaccel', self.hwaccel]
+
+    def _hwaccel_filter(self, filters: str) -> str:
+        """Prefix a filter chain so it runs on CPU-side frames."""
+        if self.hwaccel == 'cuda':
+            return f"hwdownload,format=nv12,{filters}"
+        return filters
+
+    def _disable_hwaccel(self) -> bool:
+        """
+        Switch to software decoding after a hardware-decoded run failed.
+
+        ffmpeg -hwaccels lists what the build supports, not what the
+        machine has, so a listed method can still fail at decode time.
+
+        Returns:
+            True if hardware decoding was on (the caller should retry)
+        """
+        if self.hwaccel is None:
+            return False
+        print(f"[UITraps] Hardware decoding ({self.hwaccel}) failed, falling back to software")
+        self.hwaccel = None
+        return True
+
     def _require_ffmpeg(self):
         """Raise error if FFmpeg is not available."""
         if not self.ffmpeg_available:
@@ -79,6 +262,9 @@ class VideoProcessor:
         """
         Get video metadata (duration, resolution, fps).
 
+        Results are cached per file and reused until its mtime changes, so
+        repeated calls for the same video only run ffprobe once.
+
         Args:
             video_path: Path to video file
 
@@ -86,6 +272,23 @@ class VideoProcessor:
             Dict with duration, width, height, fps
         """
         self._require_ffmpeg()
+        abs_path = os.path.abspath(video_path)
+        try:
+            mtime = os.stat(abs_path).st_mtime_ns
+        except OSError:
+            mtime = None
+
+        cached = self._info_cache.get(abs_path)
+        if cached is not None and mtime is not None and cached[0] == mtime:
+            return dict(cached[1])
+
+        info = self._probe_video(video_path)
+        if mtime is not None:
+            self._info_cache[abs_path] = (mtime, info)
+        return dict(info)
+
+    def _probe_video(self, video_path: str) -> dict:
+        """Run ffprobe on a video and parse its metadata (uncached)."""
         cmd = [
             self.ffprobe_path,
             '-v', 'quiet',
@@ -95,9 +298,12 @@ class VideoProcessor:
             video_path
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # Only stdout (the JSON) is used; with -v quiet stderr carries nothing
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
         if result.returncode != 0:
-            raise ValueError(f"Failed to read video: {result.stderr}")
+            raise ValueError(
+                f"Failed to read video: ffprobe exited with status {result.returncode}"
+            )
 
         data = json.loads(result.stdout)
 
@@ -133,7 +339,8 @@ class VideoProcessor:
         Estimate how many frames will be extracted.
 
         This is a rough estimate based on video duration.
-        Actual frame count depends on scene changes.
+        Actual frame count depends on scene changes. Uses the cached
+        get_video_info() result, so it is free after a probe.
 
         Args:
             video_path: Path to video file
@@ -175,6 +382,78 @@ class VideoProcessor:
         scene_threshold = scene_threshold or self.DEFAULT_SCENE_THRESHOLD
         max_frames = max_frames or self.MAX_FRAMES
 
+        video_path, output_dir = self._prepare_extraction(video_path, output_dir)
+
+        # Hand off to the persistent worker when it is running
+        job = _ExtractionJob(video_path, output_dir, scene_threshold, max_frames)
+        if self._submit_to_worker(job):
+            return job.future.result()
+
+        if PYAV_AVAILABLE:
+            frames = self._extract_scene_frames_pyav(
+                video_path, output_dir, scene_threshold, max_frames
+            )
+            if frames is not None:
+                return frames
+
+        frame_files, scene_count, timestamps = self._run_scene_detection(
+            video_path, output_dir, scene_threshold, max_frames
+        )
+        return self._collect_scene_frames(
+            video_path, output_dir, frame_files, scene_count, timestamps
+        )
+
+    def extract_many(
+        self,
+        video_paths: List[str],
+        output_root: str = None,
+        scene_threshold: float = None,
+        max_frames: int = None
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Extract frames from several videos in parallel, one process each.
+
+        Concurrency is capped at min(CPU count, number of videos). Each
+        worker process gets its own VideoProcessor built from this one's
+        ffmpeg/ffprobe paths, so the binaries are only looked up once.
+
+        Args:
+            video_paths: Paths to input videos
+            output_root: Parent directory for per-video frame directories
+                         (a temp dir per video if None)
+            scene_threshold: Scene change sensitivity (0.0-1.0)
+            max_frames: Maximum frames to extract per video
+
+        Returns:
+            List of (frame_path, timestamp) lists, in input order
+        """
+        self._require_ffmpeg()
+        jobs = []
+        for i, video_path in enumerate(video_paths):
+            output_dir = None
+            if output_root is not None:
+                output_dir = os.path.join(
+                    output_root, f"{i:04d}_{Path(video_path).stem}"
+                )
+            jobs.append((str(video_path), output_dir, scene_threshold, max_frames))
+
+        if len(jobs) <= 1:
+            return [self.extract_frames(*job) for job in jobs]
+
+        with ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, len(jobs)),
+            initializer=_init_pool_worker,
+            initargs=(self.ffmpeg_path, self.ffprobe_path)
+        ) as pool:
+            return list(pool.map(_extract_in_pool_worker, jobs))
+
+    def _prepare_extraction(self, video_path: str, output_dir: Optional[str]) -> Tuple[Path, str]:
+        """
+        Validate an input video and create its output directory.
+
+        Returns:
+            (video_path as a Path, output directory - a new temp dir if None)
+        """
         # Validate input
         video_path = Path(video_path)
         if not video_path.exists():
@@ -192,46 +471,198 @@ class VideoProcessor:
         else:
             os.makedirs(output_dir, exist_ok=True)
 
-        output_pattern = os.path.join(output_dir, 'frame_%04d.png')
+        return video_path, output_dir
 
+    def _run_scene_detection(
+        self,
+        video_path: Path,
+        output_dir: str,
+        scene_threshold: float,
+        max_frames: int
+    ) -> Tuple[List[str], int, List[float]]:
+        """
+        Run one-shot FFmpeg scene detection on a video.
+
+        Returns:
+            (paths of the first max_frames frames written, total scene
+            frames, presentation times of all scene frames from showinfo)
+        """
         # FFmpeg command with scene detection
-        # select='gt(scene,0.3)' extracts frames where scene change > threshold
+        # select='gt(scene,0.3)' extracts frames where scene change > threshold.
+        # Frames are streamed back as MJPEG over stdout, which is much cheaper
+        # to encode than PNG and avoids a round trip through ffmpeg's own files;
+        # showinfo logs each selected frame's pts_time to stderr.
         cmd = [
             self.ffmpeg_path,
+            *self._hwaccel_input_args(),
             '-i', str(video_path),
-            '-vf', f"select='gt(scene,{scene_threshold})',showinfo",
+            '-vf', self._hwaccel_filter(f"select='gt(scene,{scene_threshold})',showinfo"),
             '-vsync', 'vfr',
-            '-frame_pts', '1',
-            output_pattern,
-            '-y'  # Overwrite
+            '-f', 'image2pipe',
+            '-vcodec', 'mjpeg',
+            '-q:v', '3',
+            'pipe:1'
         ]
 
-        # Run FFmpeg
-        result = subprocess.run(
+        # Run FFmpeg, writing out the first max_frames frames and counting
+        # the rest. stderr is drained on a thread so neither pipe can fill
+        # up and stall ffmpeg.
+        frame_files = []
+        scene_count = 0
+        timestamps = []
+        process = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=1 << 20
         )
 
+        def read_showinfo():
+            for line in process.stderr:
+                match = _PTS_TIME_RE.search(line)
+                if match:
+                    timestamps.append(float(match.group(1)))
+
+        stderr_reader = threading.Thread(target=read_showinfo, daemon=True)
+        stderr_reader.start()
+        timed_out = threading.Event()
+
+        def kill_on_timeout():
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(300, kill_on_timeout)  # 5 minute timeout
+        timer.start()
+        try:
+            for jpeg in _iter_mjpeg(process.stdout):
+                scene_count += 1
+                if len(frame_files) < max_frames:
+                    frame_path = os.path.join(output_dir, f'frame_{scene_count:04d}.jpg')
+                    with open(frame_path, 'wb') as f:
+                        f.write(jpeg)
+                    frame_files.append(frame_path)
+            process.wait()
+            stderr_reader.join()
+        finally:
+            timer.cancel()
+            process.stdout.close()
+            process.stderr.close()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, 300)
+
+        # A non-zero exit (including a negative one from a signal) is a failure
+        if process.returncode != 0 and scene_count == 0 and self._disable_hwaccel():
+            return self._run_scene_detection(
+                video_path, output_dir, scene_threshold, max_frames
+            )
+
+        return frame_files, scene_count, timestamps
+
+    def _extract_scene_frames_pyav(
+        self,
+        video_path: Path,
+        output_dir: str,
+        scene_threshold: float,
+        max_frames: int
+    ) -> Optional[List[Tuple[str, float]]]:
+        """
+        Scene detection in-process with PyAV, without spawning ffmpeg.
+
+        Scores each frame as ffmpeg's select filter does for 8-bit YUV input:
+        mafd is the mean absolute difference of the luma plane from the
+        previous frame (0-255), and scene = min(mafd, |mafd - previous
+        mafd|) / 100, clipped to 1. This reproduces ffmpeg's
+        lavfi.scene_score, so scene_threshold selects the same frames on
+        both paths. Selected frames are JPEG-encoded with libav's mjpeg
+        encoder and keep their real presentation timestamps.
+
+        Returns:
+            List of (frame_path, timestamp) tuples, or None if PyAV could
+            not decode the video (the caller falls back to ffmpeg)
+        """
+        frames = []
+        scene_count = 0
+        try:
+            with av.open(str(video_path)) as container:
+                stream = container.streams.video[0]
+                stream.codec_context.thread_type = 'AUTO'
+
+                encoder = av.CodecContext.create('mjpeg', 'w')
+                encoder.width = stream.codec_context.width
+                encoder.height = stream.codec_context.height
+                encoder.pix_fmt = 'yuvj420p'
+                encoder.time_base = stream.time_base
+                encoder.flags |= av.codec.context.Flags.qscale
+                encoder.global_quality = 3 * _FF_QP2LAMBDA  # -q:v 3
+
+                prev = None
+                prev_mafd = 0.0
+                for frame in container.decode(stream):
+                    # Luma plane: the first `height` rows of a yuv420p array
+                    curr = frame.to_ndarray(format='yuv420p')[:frame.height].astype(np.int16)
+                    if prev is not None:
+                        mafd = float(np.mean(np.abs(curr - prev)))
+                        score = min(1.0, min(mafd, abs(mafd - prev_mafd)) / 100)
+                        prev_mafd = mafd
+                        if score > scene_threshold:
+                            scene_count += 1
+                            if len(frames) < max_frames:
+                                frame_path = os.path.join(output_dir, f'frame_{scene_count:04d}.jpg')
+                                packets = encoder.encode(frame.reformat(format='yuvj420p'))
+                                with open(frame_path, 'wb') as f:
+                                    for packet in packets:
+                                        f.write(bytes(packet))
+                                frames.append((frame_path, float(frame.time or 0.0)))
+                    prev = curr
+        except Exception as e:
+            # Any PyAV failure (decode errors, API differences between PyAV
+            # versions, ...) falls back to the ffmpeg subprocess path
+            print(f"[UITraps] PyAV could not decode {video_path.name}, using ffmpeg: {e}")
+            return None
+
+        # If scene detection found too few frames, fall back to interval extraction
+        if scene_count < self.MIN_FRAMES:
+            return self._extract_interval_frames(
+                video_path, output_dir, self.MIN_FRAMES
+            )
+
+        return frames
+
+    def _collect_scene_frames(
+        self,
+        video_path: Path,
+        output_dir: str,
+        frame_files: List[str],
+        scene_count: int,
+        timestamps: Optional[List[float]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Turn scene-detection output into (frame_path, timestamp) tuples.
+
+        Uses the frames' real timestamps when given (one per scene frame),
+        otherwise spreads estimates over the video's duration. Falls back to
+        interval extraction when too few scenes were found.
+        """
         # Collect extracted frames
         frames = []
-        frame_files = sorted(Path(output_dir).glob('frame_*.png'))
 
         # If scene detection found too few frames, fall back to interval extraction
-        if len(frame_files) < self.MIN_FRAMES:
+        if scene_count < self.MIN_FRAMES:
             frames = self._extract_interval_frames(
                 video_path, output_dir, self.MIN_FRAMES
             )
+        elif timestamps is not None and len(timestamps) == scene_count:
+            frames = list(zip(frame_files, timestamps))
         else:
-            # Parse timestamps from filenames or estimate
+            # Estimate timestamps
             info = self.get_video_info(str(video_path))
             duration = info['duration']
 
-            for i, frame_path in enumerate(frame_files[:max_frames]):
+            for i, frame_path in enumerate(frame_files):
                 # Estimate timestamp based on frame position
-                timestamp = (i / max(len(frame_files), 1)) * duration
-                frames.append((str(frame_path), timestamp))
+                timestamp = (i / scene_count) * duration
+                frames.append((frame_path, timestamp))
 
         return frames
 
@@ -248,30 +679,207 @@ class VideoProcessor:
         """
         info = self.get_video_info(str(video_path))
         duration = info['duration']
+        fps = info['fps']
 
-        frames = []
         interval = duration / (num_frames + 1)
+        timestamps = [i * interval for i in range(1, num_frames + 1)]
 
-        for i in range(1, num_frames + 1):
-            timestamp = i * interval
-            output_path = os.path.join(output_dir, f'interval_{i:04d}.png')
-
-            cmd = [
-                self.ffmpeg_path,
-                '-ss', str(timestamp),
-                '-i', str(video_path),
-                '-vframes', '1',
-                '-q:v', '2',
-                output_path,
-                '-y'
-            ]
+        # Map each timestamp to a frame index, dropping repeats (short or
+        # low-fps videos) so every selected frame pairs with its own time
+        targets = []
+        for timestamp in timestamps:
+            index = int(timestamp * fps)
+            if not targets or targets[-1][0] != index:
+                targets.append((index, timestamp))
+
+        # Select all target frames by index in a single decode pass instead
+        # of seeking and re-opening the video once per frame
+        select_expr = '+'.join(f"eq(n,{index})" for index, _ in targets)
+        output_pattern = os.path.join(output_dir, 'interval_%04d.png')
+
+        cmd = [
+            self.ffmpeg_path,
+            *self._hwaccel_input_args(),
+            '-i', str(video_path),
+            '-vf', self._hwaccel_filter(f"select='{select_expr}',setpts=N/TB"),
+            '-vsync', 'vfr',
+            '-q:v', '2',
+            output_pattern,
+            '-y'
+        ]
+
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=300
+        )
+        if result.returncode != 0 and self._disable_hwaccel():
+            return self._extract_interval_frames(video_path, output_dir, num_frames)
 
-            subprocess.run(cmd, capture_output=True, timeout=30)
+        frame_files = _list_frame_files(output_dir, 'interval_', '.png')
+        return [
+            (str(frame_path), timestamp)
+            for frame_path, (_, timestamp) in zip(frame_files, targets)
+        ]
 
-            if os.path.exists(output_path):
-                frames.append((output_path, timestamp))
+    # --- Persistent worker ---
 
-        return frames
+    def start_worker(self) -> None:
+        """
+        Start the persistent extraction worker.
+
+        While it runs, extract_frames() hands scene detection to one
+        background thread, which decodes all videos queued at that moment
+        with a single ffmpeg process instead of spawning one per video.
+        No-op if the worker is already running.
+        """
+        self._require_ffmpeg()
+        with self._worker_lock:
+            if self._worker is not None:
+                return
+            self._worker = threading.Thread(
+                target=self._worker_loop,
+                name='video-worker',
+                daemon=True
+            )
+            self._worker.start()
+
+    def stop_worker(self) -> None:
+        """Stop the extraction worker once it has finished queued jobs."""
+        with self._worker_lock:
+            worker, self._worker = self._worker, None
+            if worker is None:
+                return
+            self._worker_jobs.put(_WORKER_STOP)
+        worker.join()
+
+    def _submit_to_worker(self, job: _ExtractionJob) -> bool:
+        """Queue a job for the worker. Returns False if it is not running."""
+        with self._worker_lock:
+            if self._worker is None:
+                return False
+            self._worker_jobs.put(job)
+            return True
+
+    def _worker_loop(self):
+        """Drain the job queue, batching waiting jobs into one ffmpeg run."""
+        carry = None
+        while True:
+            job = carry if carry is not None else self._worker_jobs.get()
+            carry = None
+            if job is _WORKER_STOP:
+                return
+
+            # Batch whatever else is already waiting; jobs sharing an
+            # output directory would overwrite each other's frames, so a
+            # clash ends the batch and carries over to the next one
+            batch = [job]
+            output_dirs = {os.path.abspath(job.output_dir)}
+            while len(batch) < _WORKER_BATCH_SIZE:
+                try:
+                    nxt = self._worker_jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is _WORKER_STOP or os.path.abspath(nxt.output_dir) in output_dirs:
+                    carry = nxt
+                    break
+                batch.append(nxt)
+                output_dirs.add(os.path.abspath(nxt.output_dir))
+
+            self._run_worker_batch(batch)
+
+    def _run_worker_batch(self, batch: List[_ExtractionJob]):
+        """Run scene detection for a batch of jobs and resolve their futures."""
+        scene_results = None
+        if len(batch) > 1:
+            try:
+                scene_results = self._run_batch_scene_detection(batch)
+            except Exception:
+                scene_results = None
+
+        for i, job in enumerate(batch):
+            try:
+                if scene_results is not None:
+                    frame_files, scene_count, timestamps = scene_results[i]
+                else:
+                    # Single job, or the batch run failed (e.g. one
+                    # unreadable video) - run each video on its own so one
+                    # bad file fails alone
+                    frame_files, scene_count, timestamps = self._run_scene_detection(
+                        job.video_path, job.output_dir,
+                        job.scene_threshold, job.max_frames
+                    )
+                job.future.set_result(self._collect_scene_frames(
+                    job.video_path, job.output_dir, frame_files,
+                    scene_count, timestamps
+                ))
+            except Exception as e:
+                job.future.set_exception(e)
+
+    def _run_batch_scene_detection(
+        self,
+        batch: List[_ExtractionJob]
+    ) -> List[Tuple[List[str], int, List[float]]]:
+        """
+        Run scene detection for several videos with a single FFmpeg process.
+
+        Each input gets its own select filter chain and its own JPEG output
+        in the job's output directory. Every chain ends in a showinfo filter
+        named after its input (showinfo@v<i>), so the pts_time lines on
+        stderr can be split back out per video.
+
+        Returns:
+            (frame paths trimmed to max_frames, total scene frames,
+            presentation times of all scene frames) per job
+        """
+        cmd = [self.ffmpeg_path, '-y']
+        for job in batch:
+            cmd += [*self._hwaccel_input_args(), '-i', str(job.video_path)]
+
+        cmd += [
+            '-filter_complex',
+            ';'.join(
+                f"[{i}:v]"
+                + self._hwaccel_filter(
+                    f"select='gt(scene,{job.scene_threshold})',showinfo@v{i}"
+                )
+                + f"[v{i}]"
+                for i, job in enumerate(batch)
+            ),
+            '-vsync', 'vfr'
+        ]
+        for i, job in enumerate(batch):
+            cmd += [
+                '-map', f'[v{i}]',
+                '-q:v', '3',
+                os.path.join(job.output_dir, 'frame_%04d.jpg')
+            ]
+
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=300 * len(batch),  # 5 minutes per video
+            check=True
+        )
+
+        timestamps = [[] for _ in batch]
+        for match in _BATCH_PTS_TIME_RE.finditer(result.stderr):
+            timestamps[int(match.group(1))].append(float(match.group(2)))
+
+        results = []
+        for i, job in enumerate(batch):
+            frame_files = _list_frame_files(job.output_dir, 'frame_', '.jpg')
+            # Keep the first max_frames frames, as the one-shot path does
+            for extra in frame_files[job.max_frames:]:
+                extra.unlink()
+            results.append((
+                [str(f) for f in frame_files[:job.max_frames]],
+                len(frame_files),
+                timestamps[i]
+            ))
+        return results
 
     def cleanup_frames(self, frame_paths: List[str]) -> None:
         """
@@ -297,6 +905,21 @@ class VideoProcessor:
                     pass
 
 
+# VideoProcessor owned by each extract_many() worker process
+_POOL_PROCESSOR: Optional[VideoProcessor] = None
+
+
+def _init_pool_worker(ffmpeg_path: str, ffprobe_path: str):
+    """ProcessPoolExecutor initializer: build this worker's VideoProcessor."""
+    global _POOL_PROCESSOR
+    _POOL_PROCESSOR = VideoProcessor(ffmpeg_path=ffmpeg_path, ffprobe_path=ffprobe_path)
+
+
+def _extract_in_pool_worker(job: tuple) -> List[Tuple[str, float]]:
+    """Run one extract_many() job in a worker process."""
+    return _POOL_PROCESSOR.extract_frames(*job)
+
+
 def is_ffmpeg_available() -> bool:
     """Check if FFmpeg is available on the system."""
     return shutil.which('ffmpeg') is not None
@@ -14,15 +14,81 @@ This module enables automated analysis of public websites by:
 4. Analyzing for UI Traps across entire flows
 """
 
+import asyncio
 import os
 import re
-import time
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
-from urllib.parse import urljoin, urlparse
+from urllib.parse import SplitResult, urlsplit
 import json
 
 
+class _FilenameCharTable(dict):
+    """
+    str.translate() table that drops characters not allowed in filenames.
+
+    Keeps word characters, whitespace and hyphens (what r'[^\w\s-]' keeps),
+    deciding each code point on first sight and caching the answer.
+    """
+
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        keep = char.isalnum() or char.isspace() or char in '_-'
+        self[codepoint] = codepoint if keep else None
+        return self[codepoint]
+
+
+# Shared translation table for WebCrawler._sanitize_filename()
+_FILENAME_TABLE = _FilenameCharTable()
+
+# Whitespace runs, including leading/trailing ones, become one underscore
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+
+# Quality for JPEG screenshots (see WebCrawler screenshot_format)
+_JPEG_QUALITY = 85
+
+# Reads the page title and all link targets in a single browser round trip
+_PAGE_DATA_JS = """() => ({
+    title: document.title,
+    links: Array.from(document.querySelectorAll('a[href]'), a => a.href)
+})"""
+
+# Pages captured concurrently (each worker has its own browser context)
+_MAX_CRAWL_WORKERS = 5
+
+# Requests aborted while capturing pages: resource types that never show in
+# a screenshot, and ad/analytics hosts that keep the network busy
+_BLOCKED_RESOURCE_TYPES = frozenset({'media', 'websocket', 'eventsource'})
+_BLOCKED_URL_RE = re.compile(
+    r'doubleclick\.net|googletagmanager\.com|google-analytics\.com'
+    r'|googlesyndication\.com|facebook\.net|hotjar\.com'
+)
+
+
+async def _route_request(route):
+    """Playwright route handler: abort requests that don't affect screenshots."""
+    request = route.request
+    if (request.resource_type in _BLOCKED_RESOURCE_TYPES
+            or _BLOCKED_URL_RE.search(request.url)):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# URLs not worth crawling: downloads/media by path extension, plus CDN,
+# API and static asset paths
+_SKIP_EXTS = frozenset({
+    '.pdf', '.zip', '.exe', '.dmg', '.jpg', '.png', '.gif', '.svg', '.mp4', '.mp3'
+})
+_SKIP_RE = re.compile(r'/(?:cdn-cgi|api|_next|assets|static)/', re.IGNORECASE)
+
+
+def _path_without_params(path: str) -> str:
+    """Drop ;params from the last path segment, as urlparse() does."""
+    i = path.find(';', path.rfind('/'))
+    return path if i < 0 else path[:i]
+
+
 class WebCrawler:
     """
     Crawls public websites and captures screenshots for UI Traps analysis.
@@ -37,7 +103,8 @@ class WebCrawler:
         wait_time: int = 2,
         viewport_width: int = 1920,
         viewport_height: int = 1080,
-        user_agent: Optional[str] = None
+        user_agent: Optional[str] = None,
+        screenshot_format: str = 'jpeg'
     ):
         """
         Initialize web crawler.
@@ -49,6 +116,8 @@ class WebCrawler:
             viewport_width: Browser viewport width (default: 1920)
             viewport_height: Browser viewport height (default: 1080)
             user_agent: Custom user agent string (optional)
+            screenshot_format: 'jpeg' (default, much faster to encode for
+                               tall full-page captures) or 'png'
         """
         self.max_pages = max_pages
         self.max_depth = max_depth
@@ -56,13 +125,14 @@ class WebCrawler:
         self.viewport_width = viewport_width
         self.viewport_height = viewport_height
         self.user_agent = user_agent
+        self.screenshot_format = screenshot_format
 
         self.visited_urls: Set[str] = set()
         self.crawled_pages: List[Dict] = []
 
         # Check if playwright is installed
         try:
-            from playwright.sync_api import sync_playwright
+            from playwright.async_api import async_playwright
             self.playwright_available = True
         except ImportError:
             self.playwright_available = False
@@ -79,11 +149,15 @@ class WebCrawler:
         Returns:
             Normalized URL string
         """
-        parsed = urlparse(url)
+        return self._normalize_from_parts(urlsplit(url))
+
+    def _normalize_from_parts(self, parsed: SplitResult) -> str:
+        """normalize_url() for an already-split URL."""
+        path = _path_without_params(parsed.path)
         # Remove fragment and normalize path
-        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        normalized = f"{parsed.scheme}://{parsed.netloc}{path}"
         # Remove trailing slash unless it's the root
-        if normalized.endswith('/') and parsed.path != '/':
+        if normalized.endswith('/') and path != '/':
             normalized = normalized[:-1]
         return normalized
 
@@ -98,8 +172,8 @@ class WebCrawler:
         Returns:
             True if same domain, False otherwise
         """
-        domain1 = urlparse(url1).netloc
-        domain2 = urlparse(url2).netloc
+        domain1 = urlsplit(url1).netloc
+        domain2 = urlsplit(url2).netloc
         return domain1 == domain2
 
     def should_crawl(self, url: str, base_url: str) -> bool:
@@ -113,8 +187,11 @@ class WebCrawler:
         Returns:
             True if should crawl, False otherwise
         """
+        # Split once; the checks below share the parts
+        parsed = urlsplit(url)
+
         # Skip if already visited
-        normalized = self.normalize_url(url)
+        normalized = self._normalize_from_parts(parsed)
         if normalized in self.visited_urls:
             return False
 
@@ -123,49 +200,26 @@ class WebCrawler:
             return False
 
         # Skip if different domain
-        if not self.is_same_domain(url, base_url):
+        if parsed.netloc != urlsplit(base_url).netloc:
             return False
 
-        # Skip common non-page URLs
-        skip_extensions = ['.pdf', '.zip', '.exe', '.dmg', '.jpg', '.png', '.gif', '.svg', '.mp4', '.mp3']
-        if any(url.lower().endswith(ext) for ext in skip_extensions):
+        # Skip common non-page URLs (by path, so query strings don't hide them)
+        path = _path_without_params(parsed.path)
+        if os.path.splitext(path)[1].lower() in _SKIP_EXTS:
             return False
 
         # Skip common patterns
-        skip_patterns = ['/cdn-cgi/', '/api/', '/_next/', '/assets/', '/static/']
-        if any(pattern in url.lower() for pattern in skip_patterns):
+        if _SKIP_RE.search(url):
             return False
 
         return True
 
-    def extract_links(self, page) -> List[str]:
-        """
-        Extract all links from a page.
-
-        Args:
-            page: Playwright page object
-
-        Returns:
-            List of absolute URLs
-        """
-        try:
-            # Get all anchor tags
-            links = page.eval_on_selector_all(
-                'a[href]',
-                'elements => elements.map(e => e.href)'
-            )
-            return [link for link in links if link]
-        except Exception as e:
-            print(f"    Warning: Failed to extract links: {e}")
-            return []
-
-    def capture_page(
+    async def capture_page(
         self,
         url: str,
         output_dir: str,
         page_number: int,
-        playwright,
-        browser
+        page
     ) -> Optional[Dict]:
         """
         Capture a single page screenshot and metadata.
@@ -174,39 +228,50 @@ class WebCrawler:
             url: URL to capture
             output_dir: Directory to save screenshot
             page_number: Sequential page number
-            playwright: Playwright instance
-            browser: Browser instance
+            page: Playwright page to navigate (reused across captures)
 
         Returns:
             Dictionary with page data or None if failed
         """
-        page = None
         try:
-            page = browser.new_page()
-
             print(f"  [{page_number}/{self.max_pages}] Loading: {url}")
 
-            # Navigate to page
-            response = page.goto(url, wait_until='networkidle', timeout=30000)
+            # Navigate to page. Waits for 'load' rather than 'networkidle',
+            # which long-polling and tracker traffic can hold off until the
+            # timeout; the wait_time pause below covers late rendering.
+            response = await page.goto(url, wait_until='load', timeout=30000)
 
             if not response or response.status >= 400:
                 print(f"    Warning: Failed to load (status {response.status if response else 'unknown'})")
                 return None
 
             # Wait for any dynamic content
-            time.sleep(self.wait_time)
-
-            # Get page metadata
-            title = page.title()
+            await asyncio.sleep(self.wait_time)
+
+            # Get page metadata and links for further crawling. If the script
+            # fails (e.g. a page that blocks evaluation), still capture the
+            # page, just without links to follow.
+            try:
+                page_data = await page.evaluate(_PAGE_DATA_JS)
+                title = page_data['title']
+                links = [link for link in page_data['links'] if link]
+            except Exception as e:
+                print(f"    Warning: Failed to extract links: {e}")
+                try:
+                    title = await page.title()
+                except Exception:
+                    title = ''
+                links = []
             page_url = page.url  # Actual URL after redirects
 
             # Take screenshot
-            screenshot_name = f"page_{page_number}_{self._sanitize_filename(title)}.png"
+            if self.screenshot_format == 'png':
+                extension, options = 'png', {'type': 'png'}
+            else:
+                extension, options = 'jpg', {'type': 'jpeg', 'quality': _JPEG_QUALITY}
+            screenshot_name = f"page_{page_number}_{self._sanitize_filename(title)}.{extension}"
             screenshot_path = Path(output_dir) / screenshot_name
-            page.screenshot(path=str(screenshot_path), full_page=True)
-
-            # Extract links for further crawling
-            links = self.extract_links(page)
+            await page.screenshot(path=str(screenshot_path), full_page=True, **options)
 
             print(f"    >> Captured: {title}")
             print(f"    Found {len(links)} links")
@@ -227,10 +292,6 @@ class WebCrawler:
             print(f"    Error: {e}")
             return None
 
-        finally:
-            if page:
-                page.close()
-
     def _sanitize_filename(self, text: str, max_length: int = 50) -> str:
         """
         Convert text to safe filename.
@@ -243,9 +304,9 @@ class WebCrawler:
             Safe filename string
         """
         # Remove invalid characters
-        safe = re.sub(r'[^\w\s-]', '', text)
+        safe = text.translate(_FILENAME_TABLE)
         # Replace spaces with underscores
-        safe = re.sub(r'[\s]+', '_', safe)
+        safe = _WHITESPACE_RUN_RE.sub('_', safe)
         # Truncate
         return safe[:max_length]
 
@@ -257,6 +318,29 @@ class WebCrawler:
         """
         Crawl website starting from given URL.
 
+        Synchronous wrapper around crawl_async(); from async code (e.g. a
+        FastAPI endpoint) await crawl_async() instead.
+
+        Args:
+            start_url: Starting URL to crawl
+            output_dir: Directory to save screenshots and data
+
+        Returns:
+            Dictionary with crawl results
+        """
+        return asyncio.run(self.crawl_async(start_url, output_dir))
+
+    async def crawl_async(
+        self,
+        start_url: str,
+        output_dir: str = "./web_crawl"
+    ) -> Dict:
+        """
+        Crawl website starting from given URL, capturing pages concurrently.
+
+        Up to _MAX_CRAWL_WORKERS pages load at once, each worker in its own
+        browser context. Links are still followed breadth-first.
+
         Args:
             start_url: Starting URL to crawl
             output_dir: Directory to save screenshots and data
@@ -271,7 +355,7 @@ class WebCrawler:
                 "  playwright install chromium"
             )
 
-        from playwright.sync_api import sync_playwright
+        from playwright.async_api import async_playwright
 
         # Create output directory
         output_path = Path(output_dir)
@@ -289,9 +373,9 @@ class WebCrawler:
         print("-"*60)
         print()
 
-        with sync_playwright() as playwright:
+        async with async_playwright() as playwright:
             # Launch browser
-            browser = playwright.chromium.launch(headless=True)
+            browser = await playwright.chromium.launch(headless=True)
 
             # Set up browser context
             context_options = {
@@ -303,44 +387,106 @@ class WebCrawler:
             if self.user_agent:
                 context_options['user_agent'] = self.user_agent
 
-            browser = playwright.chromium.launch(headless=True)
-
             # Track URLs to crawl at each depth level
-            urls_to_crawl = [(start_url, 0)]  # (url, depth)
-            page_number = 0
+            urls_to_crawl: asyncio.Queue = asyncio.Queue()
+            urls_to_crawl.put_nowait((start_url, 0))  # (url, depth)
 
-            while urls_to_crawl and page_number < self.max_pages:
-                current_url, depth = urls_to_crawl.pop(0)
-
-                # Check if should crawl
-                if not self.should_crawl(current_url, start_url):
-                    continue
-
-                # Skip if depth exceeded
-                if depth > self.max_depth:
-                    continue
-
-                page_number += 1
-
-                # Capture page
-                page_data = self.capture_page(
-                    current_url,
-                    output_dir,
-                    page_number,
-                    playwright,
-                    browser
-                )
-
-                if page_data:
-                    self.crawled_pages.append(page_data)
-
-                    # Add links for next depth level
-                    if depth < self.max_depth:
-                        for link in page_data['links']:
-                            if self.should_crawl(link, start_url):
-                                urls_to_crawl.append((link, depth + 1))
+            # URLs taken by a worker, so concurrent workers don't load the
+            # same page twice. Checks and updates happen between awaits, so
+            # the single-threaded event loop needs no lock around them.
+            claimed: Set[str] = set()
+            page_number = 0
 
-            browser.close()
+            async def crawl_worker():
+                nonlocal page_number
+                # One context and one page per worker; navigating an open
+                # page is much cheaper than creating a page per URL. If setup
+                # fails (e.g. the browser crashed) the worker keeps draining
+                # the queue so urls_to_crawl.join() still returns.
+                context = None
+                page = None
+                try:
+                    context = await browser.new_context(**context_options)
+                    await context.route('**/*', _route_request)
+                    page = await context.new_page()
+                except Exception as e:
+                    print(f"    Error: Failed to open browser page: {e}")
+
+                try:
+                    while True:
+                        current_url, depth = await urls_to_crawl.get()
+                        try:
+                            if page is None:
+                                continue
+
+                            # Check if should crawl
+                            if page_number >= self.max_pages:
+                                continue
+                            if not self.should_crawl(current_url, start_url):
+                                continue
+
+                            # Skip if depth exceeded
+                            if depth > self.max_depth:
+                                continue
+
+                            normalized = self.normalize_url(current_url)
+                            if normalized in claimed:
+                                continue
+                            claimed.add(normalized)
+
+                            page_number += 1
+
+                            # Replace the page if it crashed or was closed
+                            if page.is_closed():
+                                try:
+                                    page = await context.new_page()
+                                except Exception as e:
+                                    print(f"    Error: Failed to reopen browser page: {e}")
+                                    page = None
+                                    continue
+
+                            # Capture page
+                            page_data = await self.capture_page(
+                                current_url,
+                                output_dir,
+                                page_number,
+                                page
+                            )
+
+                            if page_data:
+                                self.crawled_pages.append(page_data)
+
+                                # Add links for next depth level
+                                if depth < self.max_depth:
+                                    for link in page_data['links']:
+                                        if self.should_crawl(link, start_url):
+                                            urls_to_crawl.put_nowait((link, depth + 1))
+                        except Exception as e:
+                            # Keep the worker alive so the queue keeps draining
+                            print(f"    Error: {e}")
+                        finally:
+                            urls_to_crawl.task_done()
+                finally:
+                    if context is not None:
+                        try:
+                            await context.close()
+                        except Exception:
+                            pass
+
+            workers = [
+                asyncio.create_task(crawl_worker())
+                for _ in range(min(self.max_pages, _MAX_CRAWL_WORKERS))
+            ]
+            try:
+                await urls_to_crawl.join()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                await browser.close()
+
+        # Pages finish out of order; report them in crawl order
+        self.crawled_pages.sort(key=lambda page: page['page_number'])
 
         print()
         print("-"*60)
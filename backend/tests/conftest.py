@@ -0,0 +1,12 @@
+"""
+Test configuration: import the src modules directly, as the scripts do,
+so modules that don't need the Anthropic SDK can be tested without it.
+The backend root is on the path too, for modules imported as src.*.
+"""
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(BACKEND_DIR / "src"))
+sys.path.insert(1, str(BACKEND_DIR))
@@ -0,0 +1,97 @@
+"""
+Tests for the /api/ask intent router decision table.
+"""
+import pytest
+
+from router import IntentMode, IntentResult, detect_intent
+from router.intent_router import MIN_CONTEXT_LENGTH, _is_context_filled, _is_nonblank
+
+CONTEXT = {
+    "users": "Professional designers",
+    "tasks": "Creating new projects",
+    "format_desc": "PNG screenshot",
+}
+FILES = ["screen.png"]
+
+
+@pytest.mark.parametrize(
+    "message, files, context, expected",
+    [
+        # Text only → CHAT, whatever the context fields hold
+        ("How do I fix this trap?", None, {}, (IntentMode.CHAT, "How do I fix this trap?", False, False)),
+        ("How do I fix this trap?", [], CONTEXT, (IntentMode.CHAT, "How do I fix this trap?", False, False)),
+        (None, None, CONTEXT, (IntentMode.CHAT, None, False, False)),
+        ("", None, {}, (IntentMode.CHAT, "", False, False)),
+        ("   ", None, {}, (IntentMode.CHAT, "   ", False, False)),
+        # Files + full context → ANALYSIS, message kept
+        (None, FILES, CONTEXT, (IntentMode.ANALYSIS, None, True, True)),
+        ("Focus on the header", FILES, CONTEXT, (IntentMode.ANALYSIS, "Focus on the header", True, True)),
+        # Files + question, no context → HYBRID
+        ("Is the header clear?", FILES, {}, (IntentMode.HYBRID, "Is the header clear?", True, False)),
+        # Files + partial context counts as no context
+        ("Is the header clear?", FILES, {"users": CONTEXT["users"]},
+         (IntentMode.HYBRID, "Is the header clear?", True, False)),
+        # Files only, blank or no message → basic ANALYSIS, message dropped
+        (None, FILES, {}, (IntentMode.ANALYSIS, None, True, False)),
+        ("", FILES, {}, (IntentMode.ANALYSIS, None, True, False)),
+        (" \t\n", FILES, {}, (IntentMode.ANALYSIS, None, True, False)),
+        (" \t\n", FILES, {"tasks": CONTEXT["tasks"]}, (IntentMode.ANALYSIS, None, True, False)),
+    ],
+)
+def test_detect_intent(message, files, context, expected):
+    mode, expected_message, has_files, has_context = expected
+
+    assert detect_intent(message=message, files=files, **context) == IntentResult(
+        mode=mode,
+        message=expected_message,
+        has_files=has_files,
+        has_context=has_context,
+    )
+
+
+# Values around MIN_CONTEXT_LENGTH, with and without surrounding whitespace
+CONTEXT_VALUES = [
+    None,
+    "",
+    " " * 12,
+    "\t\n \xa0\u3000" * 3,
+    "x" * (MIN_CONTEXT_LENGTH - 1),
+    "x" * MIN_CONTEXT_LENGTH,
+    "x" * (MIN_CONTEXT_LENGTH + 1),
+    " " + "x" * (MIN_CONTEXT_LENGTH - 1),
+    "x" * (MIN_CONTEXT_LENGTH - 1) + "\n",
+    "  " + "x" * MIN_CONTEXT_LENGTH + "  ",
+    " " + "x" * (MIN_CONTEXT_LENGTH - 1),
+    "x" + " " * (MIN_CONTEXT_LENGTH - 2) + "x",
+]
+
+MESSAGE_VALUES = [None, "", " ", " \t\n\r", "  ", "x", " x ", "\nquestion?\n"]
+
+
+@pytest.mark.parametrize("value", CONTEXT_VALUES)
+def test_is_context_filled_matches_strip(value):
+    expected = bool(value) and len(value.strip()) >= MIN_CONTEXT_LENGTH
+    assert _is_context_filled(value) is expected
+
+
+@pytest.mark.parametrize("value", MESSAGE_VALUES)
+def test_is_nonblank_matches_strip(value):
+    assert _is_nonblank(value) is bool(value and value.strip())
+
+
+@pytest.mark.parametrize(
+    "users, expected_mode",
+    [
+        ("x" * MIN_CONTEXT_LENGTH, IntentMode.ANALYSIS),
+        ("  " + "x" * MIN_CONTEXT_LENGTH + "  ", IntentMode.ANALYSIS),
+        ("x" * (MIN_CONTEXT_LENGTH - 1), IntentMode.HYBRID),
+        (" " + "x" * (MIN_CONTEXT_LENGTH - 1), IntentMode.HYBRID),
+        (" " * (MIN_CONTEXT_LENGTH + 5), IntentMode.HYBRID),
+    ],
+)
+def test_detect_intent_context_length_boundary(users, expected_mode):
+    context = dict(CONTEXT, users=users)
+    result = detect_intent(message="Is the header clear?", files=FILES, **context)
+
+    assert result.mode == expected_mode
+    assert result.has_context is (expected_mode == IntentMode.ANALYSIS)
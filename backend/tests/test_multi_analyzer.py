@@ -0,0 +1,24 @@
+"""
+Tests for the frame image loading used by video analysis.
+"""
+import pytest
+
+# multi_analyzer imports the analyzer, which needs the Anthropic SDK
+pytest.importorskip("anthropic")
+
+from src.analyzer import UITrapsAnalyzer  # noqa: E402
+from src.multi_analyzer import _image_block_from_data_url, _load_image_as_base64  # noqa: E402
+
+
+@pytest.mark.parametrize("filename", ["frame.png", "frame.jpg", "frame.JPEG"])
+def test_image_block_matches_analyzer_load(tmp_path, filename):
+    frame_path = tmp_path / filename
+    frame_path.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(range(256)))
+
+    block = _image_block_from_data_url(_load_image_as_base64(str(frame_path)))
+
+    assert block == UITrapsAnalyzer._load_image(None, str(frame_path))
+
+
+def test_missing_frame_loads_as_none(tmp_path):
+    assert _load_image_as_base64(str(tmp_path / "missing.png")) is None
@@ -0,0 +1,185 @@
+"""
+Tests for the prompt builders: the messages sent to Claude must stay
+byte-for-byte stable, so they are compared against fixed expected text.
+"""
+import pytest
+
+import prompts
+
+USER_CONTEXT = {
+    "users": "Professional designers",
+    "tasks": "Creating projects",
+    "format": "PNG screenshot",
+    "content_type": "website",
+}
+
+PAGE_CONTEXT = {
+    "page_role": "product",
+    "page_title": "Shoes",
+    "page_url": "https://shop.example/shoes",
+    "relevant_tasks": ["Compare products", "Add to cart"],
+    "site_pages": ["Home", "Cart"],
+}
+
+IMAGE = {"type": "image", "source": {"type": "base64", "media_type": "image/png", "data": "AAAA"}}
+
+EXPECTED_USER_TEXT = """Please analyze this UI design using the UI Tenets & Traps framework.
+
+CONTEXT PROVIDED BY USER:
+
+1. WHO ARE THE USERS?
+Professional designers
+
+2. WHAT ARE THE KEY USER TASKS?
+Creating projects
+
+3. DESIGN FORMAT:
+PNG screenshot
+
+4. CONTENT TYPE: WEBSITE
+   Public-facing website (marketing, e-commerce, informational)
+
+   **Analysis Focus:** Full trap analysis is appropriate. Focus on navigation, information architecture, and task completion.
+
+---
+
+Perform a complete UI Tenets & Traps analysis following the methodology in your training content.
+
+Remember to (as specified in your system prompt):
+- Check all 27 Traps; gated procedure for Information Overload
+- Specific locations; calibrated severity (Critical/Moderate/Minor)
+- Respect page roles and Website content type
+- Positive observations; traps checked but not found
+- Submit via the ui_analysis_report tool
+
+Begin your analysis now."""
+
+EXPECTED_PAGE_TEXT = """Please analyze this UI design using the UI Tenets & Traps framework.
+
+CONTEXT PROVIDED BY USER:
+
+1. WHO ARE THE USERS?
+Professional designers
+
+2. WHAT IS THEIR EXPERTISE LEVEL?
+Expert users
+
+3. WHAT ARE THE KEY USER TASKS?
+Creating projects
+
+4. DESIGN FORMAT:
+PNG screenshot
+
+5. CONTENT TYPE: OTHER
+   Other type of interface
+
+   **Analysis Focus:** Standard trap analysis. Adjust expectations based on the specific context provided.
+
+6. PAGE CONTEXT (IMPORTANT - Read Before Analyzing):
+
+   Page Role: PRODUCT
+   Page Title: Shoes
+   Page URL: https://shop.example/shoes
+
+   Tasks RELEVANT to this page type:
+      - Compare products
+   - Add to cart
+
+   Other pages on this site: Home, Cart
+
+   ⚠️ IMPORTANT: Only evaluate tasks that are APPROPRIATE for this page role.
+   Do NOT flag missing elements that belong on other page types.
+   DO flag if there's no clear PATH (navigation/link) to accomplish tasks.
+
+---
+
+---
+
+Perform a complete UI Tenets & Traps analysis following the methodology in your training content.
+
+Remember to (as specified in your system prompt):
+- Check all 27 Traps; gated procedure for Information Overload
+- Specific locations; calibrated severity (Critical/Moderate/Minor)
+- Respect page roles and Other content type
+- Positive observations; traps checked but not found
+- Submit via the ui_analysis_report tool
+
+Begin your analysis now."""
+
+
+@pytest.fixture
+def training_content(monkeypatch):
+    monkeypatch.setattr(prompts, "load_training_content", lambda: "TRAINING")
+
+
+def test_system_prompt_with_caching(training_content):
+    blocks = prompts.build_system_prompt(use_caching=True)
+
+    assert blocks == [
+        {"type": "text", "text": prompts._SYSTEM_PROMPT_INTRO},
+        {
+            "type": "text",
+            "text": "\n\n===== UI TENETS & TRAPS TRAINING CONTENT =====\n\nTRAINING",
+            "cache_control": {"type": "ephemeral"},
+        },
+    ]
+    assert blocks[0]["text"].startswith(
+        "You are an expert UI analyst specializing in the proprietary "
+        "UI Tenets & Traps heuristic framework.\n\n"
+    )
+    assert blocks[0]["text"].endswith(
+        "You will submit your analysis using the ui_analysis_report tool "
+        "with all required fields including potential_issues."
+    )
+
+
+def test_system_prompt_without_caching(training_content):
+    assert prompts.build_system_prompt(use_caching=False) == [
+        {
+            "type": "text",
+            "text": prompts._SYSTEM_PROMPT_INTRO
+            + "\n\n===== UI TENETS & TRAPS TRAINING CONTENT =====\n\nTRAINING",
+        }
+    ]
+
+
+def test_user_message():
+    assert prompts.build_user_message(USER_CONTEXT, IMAGE) == [
+        IMAGE,
+        {"type": "text", "text": EXPECTED_USER_TEXT},
+    ]
+
+
+def test_user_message_without_image():
+    assert prompts.build_user_message(USER_CONTEXT) == [
+        {"type": "text", "text": EXPECTED_USER_TEXT},
+    ]
+
+
+def test_user_message_with_expertise_and_page_context():
+    user_context = dict(USER_CONTEXT, expertise="Expert users", content_type="prototype")
+
+    assert prompts.build_user_message(user_context, page_context=PAGE_CONTEXT) == [
+        {"type": "text", "text": EXPECTED_PAGE_TEXT},
+    ]
+
+
+def test_video_message_ends_with_frame_position():
+    message = prompts.build_user_message(
+        USER_CONTEXT, IMAGE, is_video_analysis=True, frame_index=2, total_frames=5
+    )
+
+    assert message[0] == IMAGE
+    assert prompts._VIDEO_SECTION in message[1]["text"]
+    assert "- Assess frame quality first; report bugs separately from traps\n" in message[1]["text"]
+    assert message[2] == {"type": "text", "text": "📍 Currently analyzing: Frame 2 of 5"}
+
+
+def test_frame_message_builder_matches_build_user_message():
+    build_frame_message = prompts.make_frame_message_builder(USER_CONTEXT, 5, PAGE_CONTEXT)
+
+    for frame_index in range(1, 6):
+        assert build_frame_message(IMAGE, frame_index) == prompts.build_user_message(
+            USER_CONTEXT, IMAGE, PAGE_CONTEXT,
+            is_multi_frame=True, frame_index=frame_index, total_frames=5
+        )
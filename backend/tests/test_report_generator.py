@@ -0,0 +1,130 @@
+"""
+Tests for the site report generator.
+
+The golden files in tests/data were rendered by the f-string HTML builder
+the Jinja2 template replaced, from the analysis result built below.
+"""
+from pathlib import Path
+
+import pytest
+
+import report_generator
+from report_generator import (
+    _batched,
+    generate_site_report_html,
+    generate_site_report_markdown,
+    iter_site_report_html,
+    iter_site_report_markdown,
+)
+
+DATA_DIR = Path(__file__).parent / "data"
+URL = "https://shop.example/"
+
+
+def _issue(trap, n, problem=None):
+    return {
+        "trap_name": trap,
+        "tenet": "UNDERSTANDABLE",
+        "location": f"Region {n}",
+        "problem": problem or f"Problem {n} " + "x" * 120,
+        "recommendation": f"Fix {n}",
+        "confidence": "high",
+    }
+
+
+@pytest.fixture
+def analysis_result():
+    recommendations = [
+        {"severity": "critical", "trap_name": "INVISIBLE ELEMENT", "page": "Home", "location": "Header",
+         "problem": "The menu icon has no visible affordance", "recommendation": "Add a text label"},
+    ]
+    recommendations += [
+        {"severity": "moderate", "trap_name": f"TRAP {i}", "page": "Products", "location": f"Card {i}",
+         "problem": f"Moderate problem {i}", "recommendation": f"Moderate fix {i}"}
+        for i in range(12)
+    ]
+    recommendations += [
+        {"severity": "minor", "trap_name": "TINY TARGET", "page": "Contact", "location": "Footer",
+         "problem": "Small links", "recommendation": "Enlarge links"},
+    ]
+    return {
+        "site_summary": {
+            "overall_assessment": "Mostly usable with a few blocking issues",
+            "critical_count": 1,
+            "moderate_count": 12,
+            "minor_count": 1,
+            "positive_count": 3,
+            "total_issues": 14,
+            "tasks_evaluated": ["Buy a product", "Contact support"],
+            "sitewide_issues": [{"trap": "UNCLEAR LABEL", "count": 3}, {"trap": "TINY TARGET", "count": 2}],
+        },
+        "statistics": {"pages_analyzed": 4},
+        "flow_analyses": [
+            {"task": "Buy a product", "complete": True, "assessment": "All steps reachable"},
+            {"task": "Contact support", "complete": False, "missing_page_types": ["contact", "faq"],
+             "assessment": "No contact page found"},
+        ],
+        "recommendations": recommendations,
+        "page_analyses": [
+            {"page": {"title": "Home", "url": "https://shop.example/"}, "page_role": "homepage", "success": True,
+             "analysis": {"statistics": {"critical_count": 1, "moderate_count": 1, "minor_count": 0},
+                          "report": {"critical_issues": [_issue("INVISIBLE ELEMENT", 1)],
+                                     "moderate_issues": [_issue("UNCLEAR LABEL", 2, "Short problem")]}}},
+            {"page": {"title": "Products", "url": "https://shop.example/products"}, "page_role": "product",
+             "success": True,
+             "analysis": {"statistics": {"critical_count": 0, "moderate_count": 0, "minor_count": 2},
+                          "report": {"critical_issues": [], "moderate_issues": []}}},
+            {"page": {"title": "Terms", "url": "https://shop.example/terms"}, "page_role": "legal",
+             "success": True, "skipped": True,
+             "analysis": {"statistics": {"critical_count": 0, "moderate_count": 0, "minor_count": 0},
+                          "report": {"critical_issues": [], "moderate_issues": []}}},
+            {"page": {"title": "Broken", "url": "https://shop.example/broken"}, "page_role": "other",
+             "success": False, "error": "Timeout loading page"},
+        ],
+        "metadata": {"timestamp": "2025-01-15 10:30", "pages_analyzed": 4, "duration_seconds": 42.5},
+    }
+
+
+def _golden(name):
+    return (DATA_DIR / name).read_text(encoding="utf-8")
+
+
+def test_html_report_matches_golden(analysis_result):
+    assert generate_site_report_html(analysis_result, URL) == _golden("site_report.html")
+
+
+def test_markdown_report_matches_golden(analysis_result):
+    assert generate_site_report_markdown(analysis_result, URL) == _golden("site_report.md")
+
+
+def test_html_report_escapes_model_text(analysis_result):
+    analysis_result["site_summary"]["overall_assessment"] = 'Users can\'t find <b>"Buy"</b> & checkout'
+
+    html = generate_site_report_html(analysis_result, URL)
+
+    assert (
+        "<strong>Overall Assessment:</strong> "
+        "Users can&#39;t find &lt;b&gt;&#34;Buy&#34;&lt;/b&gt; &amp; checkout\n"
+    ) in html
+
+
+def test_streamed_html_matches_full_report(analysis_result):
+    assert "".join(iter_site_report_html(analysis_result, URL)) == generate_site_report_html(analysis_result, URL)
+
+
+def test_streamed_markdown_matches_full_report(analysis_result):
+    assert "".join(iter_site_report_markdown(analysis_result, URL)) == generate_site_report_markdown(
+        analysis_result, URL
+    )
+
+
+def test_streamed_chunks_are_batched(analysis_result):
+    chunks = list(iter_site_report_html(analysis_result, URL))
+    assert len(chunks) > 1
+    assert all(len(chunk) >= report_generator._STREAM_CHUNK_SIZE for chunk in chunks[:-1])
+
+
+def test_batched_joins_small_chunks():
+    chunks = list(_batched(iter(["ab", "c", "def", "g", "", "hi"]), min_size=3))
+    assert chunks == ["abc", "def", "ghi"]
+    assert list(_batched(iter([]), min_size=3)) == []
@@ -0,0 +1,101 @@
+"""
+Tests for the UI analysis schema and its validator.
+"""
+import json
+
+import pytest
+
+from schema import (
+    UI_ANALYSIS_SCHEMA,
+    get_ui_analysis_schema,
+    get_ui_analysis_tool_schema,
+    get_ui_analysis_validator,
+    validate_ui_analysis,
+)
+
+jsonschema = pytest.importorskip("jsonschema")
+
+
+def _issue(**overrides):
+    issue = {
+        "trap_name": "INVISIBLE ELEMENT",
+        "tenet": "UNDERSTANDABLE",
+        "location": "Header",
+        "problem": "The menu icon has no visible affordance.",
+        "recommendation": "Add a label next to the icon.",
+        "confidence": "high",
+    }
+    issue.update(overrides)
+    return issue
+
+
+def _report(**overrides):
+    report = {
+        "summary": [f"Finding {i}." for i in range(5)],
+        "critical_issues": [_issue()],
+        "moderate_issues": [],
+        "minor_issues": [],
+        "positive_observations": ["Clear visual hierarchy."],
+        "potential_issues": [],
+        "traps_checked_not_found": ["GRATUITOUS REDUNDANCY"],
+    }
+    report.update(overrides)
+    return report
+
+
+def test_validator_accepts_valid_report():
+    assert list(get_ui_analysis_validator().iter_errors(_report())) == []
+
+
+def test_validator_reports_missing_fields_and_bad_values():
+    report = _report(critical_issues=[_issue(confidence="certain")])
+    del report["minor_issues"]
+
+    messages = [error.message for error in get_ui_analysis_validator().iter_errors(report)]
+
+    assert any("'minor_issues' is a required property" in m for m in messages)
+    assert any("'certain' is not one of" in m for m in messages)
+
+
+def test_validator_rejects_short_summary():
+    report = _report(summary=["Only one bullet."])
+    with pytest.raises(jsonschema.ValidationError):
+        get_ui_analysis_validator().validate(report)
+
+
+def test_validator_is_built_once():
+    assert get_ui_analysis_validator() is get_ui_analysis_validator()
+
+
+def test_fast_validator_accepts_valid_report():
+    pytest.importorskip("fastjsonschema")
+    report = _report()
+    assert validate_ui_analysis(report) == report
+
+
+def test_fast_validator_rejects_bad_values():
+    fastjsonschema = pytest.importorskip("fastjsonschema")
+    report = _report(critical_issues=[_issue(confidence="certain")])
+
+    with pytest.raises(fastjsonschema.JsonSchemaValueException) as excinfo:
+        validate_ui_analysis(report)
+    assert excinfo.value.name == "data.critical_issues[0].confidence"
+
+
+def test_fast_validator_rejects_short_summary():
+    fastjsonschema = pytest.importorskip("fastjsonschema")
+    with pytest.raises(fastjsonschema.JsonSchemaValueException):
+        validate_ui_analysis(_report(summary=["Only one bullet."]))
+
+
+def test_schema_is_read_only_at_every_level():
+    schema = get_ui_analysis_schema()
+    with pytest.raises(TypeError):
+        schema["properties"]["summary"]["minItems"] = 0
+    with pytest.raises(AttributeError):
+        schema["required"].append("extra")
+
+
+def test_tool_schema_is_plain_json():
+    tool_schema = get_ui_analysis_tool_schema()
+    assert json.loads(json.dumps(tool_schema)) == UI_ANALYSIS_SCHEMA
@@ -0,0 +1,187 @@
+"""
+Tests for site-wide aggregation in SiteAnalyzer, with a stand-in for the
+page analyzer so no API calls are made.
+"""
+import pytest
+
+# site_analyzer imports the analyzer, which needs the Anthropic SDK
+pytest.importorskip("anthropic")
+
+from site_analyzer import SiteAnalyzer  # noqa: E402
+
+USER_CONTEXT = {
+    "users": "Online shoppers on desktop",
+    "tasks": "Buy a product",
+    "format": "PNG screenshot",
+}
+
+
+def _issue(trap_name, recommendation, location="Header"):
+    return {
+        "trap_name": trap_name,
+        "tenet": "UNDERSTANDABLE",
+        "location": location,
+        "problem": f"{trap_name} problem at {location}",
+        "recommendation": recommendation,
+        "confidence": "high",
+    }
+
+
+def _result(critical=(), moderate=(), minor=(), positive=0):
+    return {
+        "report": {
+            "critical_issues": list(critical),
+            "moderate_issues": list(moderate),
+            "minor_issues": list(minor),
+        },
+        "statistics": {
+            "critical_count": len(critical),
+            "moderate_count": len(moderate),
+            "minor_count": len(minor),
+            "positive_count": positive,
+        },
+    }
+
+
+HOME_CRITICAL = _issue("INVISIBLE ELEMENT", "Add a text label to the menu icon")
+HOME_MODERATE = _issue("UNCLEAR LABEL", "Rename the Go button", "Search bar")
+HOME_MINOR = _issue("TINY TARGET", "Enlarge the footer links", "Footer")
+PRODUCTS_CRITICAL = _issue("INVISIBLE ELEMENT", "Add a text label to the menu icon", "Sidebar")
+PRODUCTS_MODERATE = _issue("UNCLEAR LABEL", "Use 'Add to cart' instead of 'Submit'", "Product card")
+PRODUCTS_MINOR = [
+    _issue("TINY TARGET", "Enlarge the footer links", "Footer"),
+    _issue("TINY TARGET", "Make the size swatches at least 44px", "Size picker"),
+]
+
+RESULTS = {
+    "home.png": _result([HOME_CRITICAL], [HOME_MODERATE], [HOME_MINOR], positive=2),
+    "products.png": _result([PRODUCTS_CRITICAL], [PRODUCTS_MODERATE], PRODUCTS_MINOR, positive=1),
+}
+
+PAGES = [
+    {"url": "https://shop.example/", "title": "Home", "screenshot_path": "home.png"},
+    {"url": "https://shop.example/products", "title": "Products", "screenshot_path": "products.png"},
+    {"url": "https://shop.example/cart", "title": "Cart", "screenshot_path": "broken.png"},
+]
+
+
+class FakeAnalyzer:
+    """Returns canned results per screenshot; raises for unknown ones."""
+
+    def __init__(self):
+        self.calls = []
+
+    def analyze_design(self, design_file, user_context, page_context=None, **kwargs):
+        self.calls.append(design_file)
+        if design_file not in RESULTS:
+            raise RuntimeError(f"Could not analyze {design_file}")
+        return RESULTS[design_file]
+
+
+@pytest.fixture
+def site_analyzer():
+    site_analyzer = SiteAnalyzer(api_key="test-key")
+    site_analyzer.analyzer = FakeAnalyzer()
+    return site_analyzer
+
+
+def _recommendation(severity, issue, page):
+    return {
+        "severity": severity,
+        "trap_name": issue["trap_name"],
+        "recommendation": issue["recommendation"],
+        "page": page,
+        "location": issue["location"],
+        "problem": issue["problem"],
+    }
+
+
+def test_aggregates_statistics_and_recommendations(site_analyzer):
+    result = site_analyzer.analyze_site(PAGES, USER_CONTEXT)
+
+    assert result["statistics"] == {
+        "total_issues": 7,
+        "critical_count": 2,
+        "moderate_count": 2,
+        "minor_count": 3,
+        "positive_count": 3,
+        "pages_analyzed": 3,
+        "pages_successful": 2,
+        "trap_frequency": {"TINY TARGET": 3, "INVISIBLE ELEMENT": 2, "UNCLEAR LABEL": 2},
+        "most_common_traps": [("TINY TARGET", 3), ("INVISIBLE ELEMENT", 2), ("UNCLEAR LABEL", 2)],
+    }
+
+    # Duplicates (same trap and recommendation) are listed once, for the
+    # first page they appear on; critical first, then moderate, then minor
+    assert result["recommendations"] == [
+        _recommendation("critical", HOME_CRITICAL, "Home"),
+        _recommendation("moderate", HOME_MODERATE, "Home"),
+        _recommendation("moderate", PRODUCTS_MODERATE, "Products"),
+        _recommendation("minor", HOME_MINOR, "Home"),
+        _recommendation("minor", PRODUCTS_MINOR[1], "Products"),
+    ]
+
+    assert result["site_summary"]["sitewide_issues"] == [
+        {"trap": "TINY TARGET", "count": 3},
+        {"trap": "INVISIBLE ELEMENT", "count": 2},
+        {"trap": "UNCLEAR LABEL", "count": 2},
+    ]
+    assert result["page_analyses"][2]["success"] is False
+
+    # Flattened issues keep their page and severity, in page order with
+    # critical issues first; the failed page contributes nothing
+    assert site_analyzer._issues_flat == [
+        ("Home", "critical", "INVISIBLE ELEMENT", HOME_CRITICAL),
+        ("Home", "moderate", "UNCLEAR LABEL", HOME_MODERATE),
+        ("Home", "minor", "TINY TARGET", HOME_MINOR),
+        ("Products", "critical", "INVISIBLE ELEMENT", PRODUCTS_CRITICAL),
+        ("Products", "moderate", "UNCLEAR LABEL", PRODUCTS_MODERATE),
+        ("Products", "minor", "TINY TARGET", PRODUCTS_MINOR[0]),
+        ("Products", "minor", "TINY TARGET", PRODUCTS_MINOR[1]),
+    ]
+
+
+def test_legal_page_without_matching_task_is_skipped(site_analyzer):
+    pages = PAGES[:1] + [
+        {"url": "https://shop.example/terms", "title": "Terms of Service", "screenshot_path": "terms.png"},
+    ]
+
+    result = site_analyzer.analyze_site(pages, USER_CONTEXT)
+
+    assert site_analyzer.analyzer.calls == ["home.png"]
+    skipped = result["page_analyses"][1]
+    assert skipped["page_role"] == "legal"
+    assert skipped["success"] is True
+    assert skipped["skipped"] is True
+    report = skipped["analysis"]["report"]
+    assert report["summary"] == ["Page skipped - no relevant tasks"]
+    for issue_list in (
+        "critical_issues", "moderate_issues", "minor_issues",
+        "positive_observations", "potential_issues", "traps_checked_not_found",
+    ):
+        assert report[issue_list] == []
+    assert skipped["analysis"]["statistics"]["total_issues"] == 0
+    assert "skipped" not in result["page_analyses"][0]
+
+
+def test_legal_page_targeted_by_a_task_is_analyzed(site_analyzer):
+    pages = [{"url": "https://shop.example/terms", "title": "Terms of Service", "screenshot_path": "home.png"}]
+    user_context = dict(USER_CONTEXT, tasks="Review terms of the store")
+
+    result = site_analyzer.analyze_site(pages, user_context)
+
+    assert site_analyzer.analyzer.calls == ["home.png"]
+    assert "skipped" not in result["page_analyses"][0]
+
+
+def test_skipped_page_reports_are_not_shared(site_analyzer):
+    pages = [
+        {"url": "https://shop.example/terms", "title": "Terms of Service", "screenshot_path": "terms.png"},
+        {"url": "https://shop.example/privacy", "title": "Privacy Policy", "screenshot_path": "privacy.png"},
+    ]
+
+    result = site_analyzer.analyze_site(pages, USER_CONTEXT)
+
+    first, second = (page["analysis"]["report"] for page in result["page_analyses"])
+    first["summary"].append("Edited")
+    assert second["summary"] == ["Page skipped - no relevant tasks"]
@@ -0,0 +1,134 @@
+"""
+Tests for usage tracking against an in-memory SQLite database.
+"""
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+# src/__init__.py imports the analyzer, which needs the Anthropic SDK
+pytest.importorskip("anthropic")
+
+from src import usage_service  # noqa: E402
+from src.database import AnalysisAudit, APIKey, UsageRecord  # noqa: E402
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    monkeypatch.setattr(usage_service, "engine", engine)
+    monkeypatch.setattr(usage_service, "_KEY_CACHE", {})
+    return engine
+
+
+@pytest.fixture
+def session(engine):
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture(params=["upsert", "fallback"])
+def upsert_mode(request, monkeypatch):
+    """Run a test with the ON CONFLICT upsert and with the ORM fallback."""
+    if request.param == "fallback":
+        monkeypatch.setattr(usage_service, "_UPSERT_INSERTS", {})
+    return request.param
+
+
+def test_increment_usage_first_call_returns_amount(session, upsert_mode):
+    assert usage_service.increment_usage(session, "key-1", 3) == 3
+
+
+def test_increment_usage_accumulates(session, upsert_mode):
+    usage_service.increment_usage(session, "key-1", 3)
+    assert usage_service.increment_usage(session, "key-1", 2) == 5
+    assert usage_service.get_usage(session, "key-1") == 5
+
+    records = session.exec(select(UsageRecord)).all()
+    assert [(r.month, r.count) for r in records] == [(usage_service.get_current_month(), 5)]
+
+
+def test_increment_usage_creates_missing_key(session, upsert_mode):
+    usage_service.increment_usage(session, "new-key", 1, default_limit=50, db_key=None)
+
+    db_key = session.exec(select(APIKey).where(APIKey.key == "new-key")).one()
+    assert db_key.monthly_limit == 50
+    assert db_key.is_active
+
+
+def test_increment_usage_with_loaded_key(session, upsert_mode):
+    db_key = usage_service.get_or_create_api_key(session, "key-1")
+
+    assert usage_service.increment_usage(session, "key-1", 4, db_key=db_key) == 4
+    assert usage_service.increment_usage(session, "key-1", 1, db_key=db_key) == 5
+
+
+def test_log_analysis_rows_land_after_flush(session):
+    db_key = usage_service.get_or_create_api_key(session, "key-1")
+    for i in range(5):
+        usage_service.log_analysis(
+            session, "key-1", "/analyze", "single_image", i, "success",
+            {"frame_count": i}, db_key=db_key
+        )
+    # db_key=None looks the key up through the session
+    usage_service.log_analysis(session, "key-1", "/analyze", "single_image", 0, "failed_auth")
+
+    usage_service.flush_audit_log()
+
+    rows = session.exec(select(AnalysisAudit).order_by(AnalysisAudit.id)).all()
+    assert [(r.api_key_id, r.credits_used, r.status) for r in rows] == (
+        [(db_key.id, i, "success") for i in range(5)] + [(db_key.id, 0, "failed_auth")]
+    )
+    assert rows[3].request_metadata == '{"frame_count":3}'
+
+
+class _Clock:
+    """Stand-in for the time module with a manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def _deactivate(engine, api_key):
+    with Session(engine) as other:
+        db_key = other.exec(select(APIKey).where(APIKey.key == api_key)).one()
+        db_key.is_active = False
+        db_key.monthly_limit = 5
+        other.add(db_key)
+        other.commit()
+
+
+def test_api_key_cache_is_stale_until_ttl_expires(engine, session, monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(usage_service, "time", clock)
+    valid_keys = {"key-1"}
+    usage_service.get_or_create_api_key(session, "key-1")
+
+    _deactivate(engine, "key-1")
+
+    # Served from the cached copy until _KEY_CACHE_TTL has passed
+    clock.now += usage_service._KEY_CACHE_TTL - 1
+    is_valid, db_key = usage_service.verify_and_load(session, "key-1", valid_keys)
+    assert is_valid and db_key.monthly_limit == 20
+
+    clock.now += 1
+    is_valid, db_key = usage_service.verify_and_load(session, "key-1", valid_keys)
+    assert not is_valid and db_key.monthly_limit == 5
+
+
+def test_invalidate_api_key_cache_applies_changes_immediately(engine, session):
+    valid_keys = {"key-1"}
+    usage_service.get_or_create_api_key(session, "key-1")
+
+    _deactivate(engine, "key-1")
+    assert usage_service.verify_and_load(session, "key-1", valid_keys)[0]
+
+    usage_service.invalidate_api_key_cache("key-1")
+    assert not usage_service.verify_and_load(session, "key-1", valid_keys)[0]
@@ -0,0 +1,32 @@
+"""
+Tests for file format validation.
+"""
+from pathlib import Path
+
+import pytest
+
+from validators import validate_file_format
+
+
+@pytest.mark.parametrize("as_path", [str, Path])
+def test_validate_file_format_accepts_str_and_path(tmp_path, as_path):
+    image = tmp_path / "screen.PNG"
+    image.write_bytes(b"\x89PNG\r\n\x1a\n")
+
+    assert validate_file_format(as_path(image)) == (True, "Valid image format: .png")
+    assert validate_file_format(as_path(tmp_path / "clip.mp4")) == (
+        False, f"File not found: {tmp_path / 'clip.mp4'}"
+    )
+    assert validate_file_format(as_path(tmp_path / "notes.txt"))[0] is False
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://www.figma.com/file/abc123/Design", True),
+        ("HTTPS://figma.com/file/abc123", True),
+        ("https://example.com/file/abc123", False),
+    ],
+)
+def test_validate_file_format_figma_urls(url, expected):
+    assert validate_file_format(url)[0] is expected
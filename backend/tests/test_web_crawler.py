@@ -0,0 +1,43 @@
+"""
+Tests for WebCrawler filename sanitizing against the original regex version.
+"""
+import re
+
+import pytest
+
+from web_crawler import WebCrawler
+
+
+def _regex_sanitize_filename(text, max_length=50):
+    safe = re.sub(r'[^\w\s-]', '', text)
+    safe = re.sub(r'[\s]+', '_', safe)
+    return safe[:max_length]
+
+
+TITLES = [
+    "",
+    "Home",
+    "Shop | Products & Deals",
+    "  Leading and trailing  ",
+    "\tTabs\tand\nnewlines\n",
+    "   ",
+    "!!!",
+    " - ",
+    "Über café – naïve résumé",
+    "日本語のページ 「タイトル」",
+    "snake_case-and-kebab",
+    "Multiple   spaces 　here",
+    "Control\x1c\x1d\x1e\x1fseparators",
+    "Emoji 🚀 launch 🎉",
+    "Digits ٣٤٥ and ½ fractions",
+    "x" * 60,
+    "word " * 20,
+]
+
+
+@pytest.mark.parametrize("title", TITLES)
+@pytest.mark.parametrize("max_length", [50, 5])
+def test_sanitize_filename_matches_regex(title, max_length):
+    assert WebCrawler._sanitize_filename(None, title, max_length) == (
+        _regex_sanitize_filename(title, max_length)
+    )